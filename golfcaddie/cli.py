@@ -1,5 +1,7 @@
 from typing import Optional
 import click
+import collections
+import functools
 import time
 import asyncio
 from dotenv import load_dotenv
@@ -14,53 +16,75 @@ from .geocode import geocode_course, extract_course_name
 from .parser import parse_intent
 
 
-def _detect_intent(text: str) -> str:
-    """Return 'weather', 'shot', or 'unknown' based on the query content."""
-    l = text.lower()
-    
-    # Golf-specific keywords and phrases
-    golf_keywords = [
-        "golf", "course", "hole", "tee", "green", "fairway", "rough", "bunker", "sand trap",
-        "par", "birdie", "eagle", "bogey", "handicap", "stroke", "putt", "chip", "pitch",
-        "iron", "wood", "driver", "wedge", "putter", "yards", "distance", "pin", "flag"
-    ]
-    
-    # Shot intent keywords/phrases - be more specific to avoid false positives
-    shot_keys = [
-        "what club",
-        "which club",
-        "recommend",
-        "suggest",
-        "should i",
-        "what should i play",
-        "how should i play",
-        "should i hit",
-        "hit",
-        "aim",
-        "carry",
-        "lay up",
-        "club do i use",
-        "use a",
-    ]
-    has_shot = any(k in l for k in shot_keys)
-
-    # Weather-specific question forms; avoid triggering on mere mentions like "into the wind"
-    weather_q_patterns = [
-        r"\bwhat(?:'s| is)?\b.*\b(wind|weather|conditions|forecast)\b",
-        r"\bhow\b.*\b(windy|wind)\b",
-        r"\bcurrent\b.*\b(conditions|wind|weather)\b",
-        r"\bforecast\b",
-        r"\btell me.*\b(about|the)?\b.*\b(conditions|weather|wind)\b",
-        r"\bcan you tell me.*\b(conditions|weather|wind)\b",
-        r"\bwhat are.*\b(conditions|weather|wind)\b",
-        r"\bcheck.*\b(conditions|weather|wind)\b",
-        r"\b(conditions|weather|wind).*\b(today|now|current)\b",
-        r"\b(today|now).*\b(conditions|weather|wind)\b",
-    ]
-    has_weather_q = any(re.search(p, l) for p in weather_q_patterns)
-    
+# Precompiled hole-number mention, e.g. "hole 7"
+_HOLE_N_RE = re.compile(r"\bhole\s+\d+\b")
+
+# Keyword groups for the session-state checks in listen(); hoisted so the
+# per-transcript loop does not rebuild the tuples on every call.
+_LOC_HINTS = ("first tee", "clubhouse", "course")
+_NEXT_HOLE_HINTS = ("next hole", "new hole", "on the next", "moved to")
+_LAYOUT_HINTS = ("bunker", "trees", "water", "dogleg", "narrow", "wide", "elevated", "downhill", "uphill")
+
+# Golf-specific keywords and phrases
+_GOLF_KEYWORDS = [
+    "golf", "course", "hole", "tee", "green", "fairway", "rough", "bunker", "sand trap",
+    "par", "birdie", "eagle", "bogey", "handicap", "stroke", "putt", "chip", "pitch",
+    "iron", "wood", "driver", "wedge", "putter", "yards", "distance", "pin", "flag"
+]
+
+# Shot intent keywords/phrases - be more specific to avoid false positives
+_SHOT_KEYS = [
+    "what club",
+    "which club",
+    "recommend",
+    "suggest",
+    "should i",
+    "what should i play",
+    "how should i play",
+    "should i hit",
+    "hit",
+    "aim",
+    "carry",
+    "lay up",
+    "club do i use",
+    "use a",
+]
+
+# Literal keyword groups are scanned as one compiled alternation each, so a
+# transcript takes a single pass regardless of how many keywords are listed.
+_SHOT_RE = re.compile("|".join(re.escape(k) for k in _SHOT_KEYS))
+_GOLF_RE = re.compile("|".join(re.escape(k) for k in _GOLF_KEYWORDS))
+
+# Weather-specific question forms; avoid triggering on mere mentions like "into the wind".
+# All alternatives are fused into one compiled pattern so each transcript is
+# scanned once instead of once per pattern.
+_WEATHER_Q_RE = re.compile(
+    "|".join(
+        [
+            r"\bwhat(?:'s| is)?\b.*\b(?:wind|weather|conditions|forecast)\b",
+            r"\bhow\b.*\b(?:windy|wind)\b",
+            r"\bcurrent\b.*\b(?:conditions|wind|weather)\b",
+            r"\bforecast\b",
+            r"\btell me.*\b(?:about|the)?\b.*\b(?:conditions|weather|wind)\b",
+            r"\bcan you tell me.*\b(?:conditions|weather|wind)\b",
+            r"\bwhat are.*\b(?:conditions|weather|wind)\b",
+            r"\bcheck.*\b(?:conditions|weather|wind)\b",
+            r"\b(?:conditions|weather|wind).*\b(?:today|now|current)\b",
+            r"\b(?:today|now).*\b(?:conditions|weather|wind)\b",
+        ]
+    )
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _classify(l: str) -> str:
+    """Classify an already-lowercased transcript; cached for repeated utterances."""
+    has_shot = _SHOT_RE.search(l) is not None
+
+    has_weather_q = _WEATHER_Q_RE.search(l) is not None
+
     # Check if query contains golf-related content
-    has_golf_context = any(keyword in l for keyword in golf_keywords)
+    has_golf_context = _GOLF_RE.search(l) is not None
 
     if has_weather_q and not has_shot:
         return "weather"
@@ -71,6 +95,15 @@ def _detect_intent(text: str) -> str:
         return "unknown"
 
 
+def _detect_intent(text: str, lower: Optional[str] = None) -> str:
+    """Return 'weather', 'shot', or 'unknown' based on the query content.
+
+    Callers that already lowercased the text can pass it via `lower` to
+    avoid a second allocation.
+    """
+    return _classify(lower if lower is not None else text.lower())
+
+
 @click.group()
 def cli():
     """Golf Caddie CLI"""
@@ -165,10 +198,13 @@ def listen(api_key: Optional[str], mock: bool, language: str,
                 click.echo(transcript)
             
             click.echo(f"🎤 Transcript: {transcript}")
-            
+
+            # Lowercase once; reused by intent detection and keyword checks below
+            lower = transcript.lower()
+
             # Parse the intent and extract any handicap mention
-            intent = _detect_intent(transcript)
-            parsed_intent = parse_intent(transcript, listen._session_cache.get("current_handicap"))  # type: ignore[attr-defined]
+            intent = _detect_intent(transcript, lower=lower)
+            parsed_intent = parse_intent(transcript, listen._session_cache.get("current_handicap"), text_l=lower)  # type: ignore[attr-defined]
             
             # Update current handicap if mentioned in speech
             if parsed_intent.handicap_mentioned is not None:
@@ -180,8 +216,7 @@ def listen(api_key: Optional[str], mock: bool, language: str,
 
             # If the user mentions specific course/hole context, attempt to refresh coords and cache conditions silently
             try:
-                lower = transcript.lower()
-                if any(k in lower for k in ("first tee", "clubhouse", "course")) or re.search(r"\bhole\s+\d+\b", lower):
+                if any(k in lower for k in _LOC_HINTS) or _HOLE_N_RE.search(lower):
                     course = extract_course_name(transcript)
                     if debug:
                         print(f"[LOC] course_query='{course}'")
@@ -234,10 +269,10 @@ def listen(api_key: Optional[str], mock: bool, language: str,
             # Maintain simple hole layout memory: if user mentions "next hole" or similar, clear it
             if not hasattr(listen, "_hole_layout"):
                 listen._hole_layout = None  # type: ignore[attr-defined]
-            if any(p in lower for p in ("next hole", "new hole", "on the next", "moved to")) or re.search(r"\bhole\s+\d+\b", lower):
+            if any(p in lower for p in _NEXT_HOLE_HINTS) or _HOLE_N_RE.search(lower):
                 listen._hole_layout = None  # type: ignore[attr-defined]
             # If user describes layout (trees left/right, water right, dogleg), capture a brief summary
-            if any(k in lower for k in ("bunker", "trees", "water", "dogleg", "narrow", "wide", "elevated", "downhill", "uphill")):
+            if any(k in lower for k in _LAYOUT_HINTS):
                 # Keep a short rolling description
                 listen._hole_layout = (transcript if len(transcript) < 240 else transcript[:240])  # type: ignore[attr-defined]
 
@@ -260,7 +295,9 @@ def listen(api_key: Optional[str], mock: bool, language: str,
             click.echo("🤔 Processing your request...")
             
             if not hasattr(listen, "_history"):
-                listen._history = []  # type: ignore[attr-defined]
+                # Bounded to the 3 shots build_prompt actually uses; entries
+                # are stored pre-truncated so prompt assembly never reslices.
+                listen._history = collections.deque(maxlen=3)  # type: ignore[attr-defined]
 
             try:
                 reply, meta = ask_openai(prompt)
@@ -272,9 +309,7 @@ def listen(api_key: Optional[str], mock: bool, language: str,
                 
                 click.echo(f"🧠 Response: {reply}")
                 await pipe.speak(reply)
-                listen._history.append((transcript, reply))  # type: ignore[attr-defined]
-                if len(listen._history) > 10:  # type: ignore[attr-defined]
-                    listen._history = listen._history[-10:]  # type: ignore[attr-defined]
+                listen._history.append((transcript[:140], reply[:140]))  # type: ignore[attr-defined]
                 click.echo("🎧 Ready for next question...")
             except Exception as e:
                 click.echo(f"OpenAI error: {e}", err=True)
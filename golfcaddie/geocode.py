@@ -1,12 +1,42 @@
 from __future__ import annotations
 
+import atexit
+import functools
 import re
 import httpx
-from typing import Tuple
+from typing import Optional, Tuple
 
 
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 
+# Precompiled patterns used on every transcript
+_WS_RE = re.compile(r"\s+")
+
+# Trailing phrases that mark the end of a course name
+_STOP_LITERALS = ("please", "give me", "weather", "report", "conditions", "what are", "today", "now", "current")
+
+# Shared pooled client so repeated geocodes reuse the TLS connection
+_CLIENT = httpx.Client(timeout=10.0, transport=httpx.HTTPTransport(retries=1))
+atexit.register(_CLIENT.close)
+
+
+def _scan_after(lower: str, anchor: str) -> Optional[int]:
+    """Find the index just past `anchor` + whitespace, honoring a word boundary before it."""
+    pos = 0
+    n = len(lower)
+    while True:
+        i = lower.find(anchor, pos)
+        if i == -1:
+            return None
+        boundary_ok = i == 0 or not (lower[i - 1].isalnum() or lower[i - 1] == "_")
+        j = i + len(anchor)
+        if boundary_ok and j < n and lower[j].isspace():
+            while j < n and lower[j].isspace():
+                j += 1
+            if j < n:
+                return j
+        pos = i + 1
+
 
 def extract_course_name(transcript: str) -> str:
     """Heuristic extraction of course name from a natural language request.
@@ -17,33 +47,33 @@ def extract_course_name(transcript: str) -> str:
     """
     text = transcript.strip()
     # Normalize spaces
-    text = re.sub(r"\s+", " ", text)
+    text = _WS_RE.sub(" ", text)
     lower = text.lower()
 
-    # Prefer phrase after "first tee of"
-    m = re.search(r"\bfirst tee of\s+(.+)", lower)
-    start_idx = None
-    if m:
-        start_idx = m.start(1)
-    else:
-        # Next: after " at "
-        m2 = re.search(r"\bat\s+(.+)", lower)
-        if m2:
-            start_idx = m2.start(1)
-        else:
-            # Fallback: after " of "
-            of_idx = lower.find(" of ")
-            if of_idx != -1:
-                start_idx = of_idx + 4
+    # Prefer phrase after "first tee of", then " at ", then " of "
+    start_idx = _scan_after(lower, "first tee of")
+    if start_idx is None:
+        start_idx = _scan_after(lower, "at")
+    if start_idx is None:
+        of_idx = lower.find(" of ")
+        if of_idx != -1:
+            start_idx = of_idx + 4
 
     if start_idx is None:
         # As a last resort, use entire text
         candidate = text
+        candidate_lower = lower
     else:
         candidate = text[start_idx:]
+        candidate_lower = lower[start_idx:]
 
-    # Stop at common trailing phrases
-    candidate = re.split(r"(?i)please|give me|weather|report|conditions|what are|today|now|current", candidate)[0]
+    # Stop at the earliest trailing stop phrase
+    cut = len(candidate)
+    for stop in _STOP_LITERALS:
+        k = candidate_lower.find(stop)
+        if k != -1 and k < cut:
+            cut = k
+    candidate = candidate[:cut]
     # Trim punctuation
     candidate = candidate.strip(" .,!?")
     return candidate.strip()
@@ -53,7 +83,14 @@ def geocode_course(query: str, *, user_agent: str = "golfcaddie/1.0") -> Tuple[f
     """Geocode a golf course or location string using OSM Nominatim.
 
     Returns (lat, lon) as floats. Raises ValueError if not found.
+    Results are memoized per normalized query, so repeated mentions of the
+    same course within a session skip the (rate-limited) network call.
     """
+    return _geocode_cached(" ".join(query.strip().lower().split()), user_agent)
+
+
+@functools.lru_cache(maxsize=1024)
+def _geocode_cached(query: str, user_agent: str) -> Tuple[float, float]:
     params = {
         "q": query,
         "format": "json",
@@ -61,16 +98,15 @@ def geocode_course(query: str, *, user_agent: str = "golfcaddie/1.0") -> Tuple[f
     }
     headers = {"User-Agent": user_agent}
     print(f"[GEOCODE] GET {NOMINATIM_URL} params={params}")
-    with httpx.Client(timeout=10.0, headers=headers) as client:
-        resp = client.get(NOMINATIM_URL, params=params)
-        print(f"[GEOCODE] status={resp.status_code}")
-        resp.raise_for_status()
-        data = resp.json()
-        if not data:
-            raise ValueError(f"No results for query: {query}")
-        lat = float(data[0]["lat"])
-        lon = float(data[0]["lon"])
-        print(f"[GEOCODE] result lat={lat} lon={lon}")
-        return lat, lon
+    resp = _CLIENT.get(NOMINATIM_URL, params=params, headers=headers)
+    print(f"[GEOCODE] status={resp.status_code}")
+    resp.raise_for_status()
+    data = resp.json()
+    if not data:
+        raise ValueError(f"No results for query: {query}")
+    lat = float(data[0]["lat"])
+    lon = float(data[0]["lon"])
+    print(f"[GEOCODE] result lat={lat} lon={lon}")
+    return lat, lon
 
 
@@ -1,12 +1,52 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI, RateLimitError
 from .statistics import get_golf_statistics
-from .parser import parse_intent
+from .parser import ParsedIntent, parse_intent
+
+
+# System message shared by every chat call.
+_SYSTEM_MESSAGE = "You are a witty golf caddie."
+
+# Mishit vocabulary fused into one case-insensitive scan. Bare substrings
+# (not \b-anchored) so inflections like "shanked"/"sliced" keep matching;
+# "ob" alone is word-bounded so it doesn't fire inside e.g. "problem".
+_BAD_RE = re.compile(r"shank|slice|hook|chunk|duff|top|water|out of bounds|\bob\b", re.IGNORECASE)
+
+# Static preamble emitted byte-identical at the START of every prompt.
+# OpenAI's server-side prompt caching only fires on identical prefixes, so
+# all per-request content (history, stats, transcript) goes AFTER this block.
+_STATIC_PREAMBLE = (
+    "You are a COURSE MANAGEMENT focused golf caddie. Your primary role is helping players "
+    "make smart, conservative decisions that minimize big numbers and play to their strengths.\n"
+    "COURSE MANAGEMENT PHILOSOPHY:\n"
+    "Golf is about hitting the LEAST WORST shot, not the perfect shot. Course management "
+    "trumps raw skill. Your job is to help players avoid disaster and play within their abilities.\n\n"
+    "Task: Recommend the SMARTEST shot for this player's skill level, not the most aggressive.\n"
+    "CORE PRINCIPLES:\n"
+    "- SAFETY FIRST: Avoid hazards, pick conservative targets, leave room for error\n"
+    "- PLAY YOUR DISTANCES: Use the performance data to recommend realistic expectations\n"
+    "- PERCENTAGES MATTER: Focus on high-percentage shots that this handicap can execute\n"
+    "- LEAVE YOURSELF OPTIONS: Consider where a miss will end up\n"
+    "- SHORT SIDE IS DEATH: Avoid short-sided positions around greens\n"
+    "- WHEN IN DOUBT, TAKE MORE CLUB and aim for center of target\n"
+    "Response Format (VOICE-FRIENDLY - no numbers, bullets, or formatting):\n"
+    "Give a natural spoken recommendation in 2 sentences maximum. Include:\n"
+    "- Club choice and target with course management reasoning\n"
+    "- One brief witty comment about smart play\n"
+    "Keep it conversational and smooth for text-to-speech playback.\n\n"
+)
 
 
 def build_prompt(
@@ -22,16 +62,20 @@ def build_prompt(
     history_block = ""
     humor_hint = ""
     if history:
-        last = history[-3:]
+        # The caller keeps history as a deque(maxlen=3) of pre-truncated
+        # (said, reply) tuples, making the [:140] below a no-op (CPython
+        # returns the same object for a whole-string slice). Unbounded
+        # lists still work; only the last 3 entries reach the prompt.
+        last = [(s[:140], r[:140]) for s, r in history]
+        del last[:-3]
         lines = []
         for i, (said, reply) in enumerate(last, 1):
-            lines.append(f"- Shot {i}: user='{said[:140]}', caddie='{reply[:140]}'")
+            lines.append(f"- Shot {i}: user='{said}', caddie='{reply}'")
         history_block = "Recent shots (use for context, but don't repeat):\n" + "\n".join(lines) + "\n\n"
 
         # Lightweight tone tweak based on the very last shot text
-        last_user, _last_reply = history[-1]
-        bad_words = ["shank", "slice", "hook", "chunk", "duff", "top", "water", "out of bounds", "OB"]
-        if any(w in last_user.lower() for w in bad_words):
+        last_user, _last_reply = last[-1]
+        if _BAD_RE.search(last_user):
             humor_hint = (
                 "- If the previous shot mentions a mishit (shank/slice/hook/chunk/top/water/OB), add a playful one-line roast acknowledging it.\n"
             )
@@ -49,30 +93,15 @@ def build_prompt(
         stats_block = ""
     else:
         handicap_prompt = ""
-        # Add golf statistics context
-        stats_block = _build_statistics_context(transcript, handicap)
+        # Parse once and add golf statistics context from the result
+        intent = parse_intent(transcript, handicap)
+        stats_block = _build_statistics_context(intent, handicap)
 
+    # Static block first (byte-identical across requests, see _STATIC_PREAMBLE),
+    # then everything that varies per request.
     return (
-        "You are a COURSE MANAGEMENT focused golf caddie. Your primary role is helping players "
-        "make smart, conservative decisions that minimize big numbers and play to their strengths.\n"
-        + history_block + handicap_prompt +
-        "COURSE MANAGEMENT PHILOSOPHY:\n"
-        "Golf is about hitting the LEAST WORST shot, not the perfect shot. Course management "
-        "trumps raw skill. Your job is to help players avoid disaster and play within their abilities.\n\n"
-        "Task: Recommend the SMARTEST shot for this player's skill level, not the most aggressive.\n"
-        "CORE PRINCIPLES:\n"
-        "- SAFETY FIRST: Avoid hazards, pick conservative targets, leave room for error\n"
-        "- PLAY YOUR DISTANCES: Use the performance data to recommend realistic expectations\n"
-        "- PERCENTAGES MATTER: Focus on high-percentage shots that this handicap can execute\n"
-        "- LEAVE YOURSELF OPTIONS: Consider where a miss will end up\n"
-        "- SHORT SIDE IS DEATH: Avoid short-sided positions around greens\n"
-        "- WHEN IN DOUBT, TAKE MORE CLUB and aim for center of target\n"
-        + humor_hint +
-        "Response Format (VOICE-FRIENDLY - no numbers, bullets, or formatting):\n"
-        "Give a natural spoken recommendation in 2 sentences maximum. Include:\n"
-        "- Club choice and target with course management reasoning\n"
-        "- One brief witty comment about smart play\n"
-        "Keep it conversational and smooth for text-to-speech playback.\n\n"
+        _STATIC_PREAMBLE
+        + history_block + handicap_prompt + humor_hint
         + conditions_block + hole_block + stats_block +
         f"Transcript: {transcript}\n"
         f"Handicap: {'Unknown - ASK FOR IT!' if handicap is None else handicap}\n"
@@ -80,28 +109,79 @@ def build_prompt(
     )
 
 
-def _build_statistics_context(transcript: str, handicap: int) -> str:
-    """Build statistics context block for the prompt."""
+@functools.lru_cache(maxsize=32)
+def _static_stats_parts(handicap: int) -> Optional[tuple[str, str]]:
+    """Handicap-only context lines, formatted once per handicap value.
+
+    Everything here depends solely on the (clamped) handicap, so the
+    f-string work is paid once per distinct handicap instead of per
+    transcript. Returns (profile line, pre-joined trailing block) or None
+    if no stats exist; distance- and warning-specific lines stay dynamic
+    in _build_statistics_context.
+    """
+    stats = get_golf_statistics().get_stats(handicap)
+    if not stats:
+        return None
+
+    profile = f"PLAYER SKILL PROFILE: {stats.category} golfer (handicap {handicap})"
+
+    tail = [
+        f"PLAYER PERFORMANCE PROFILE:",
+        f"- Overall GIR: {stats.greens_in_regulation.overall}% (play to your average)",
+        f"- Fairways hit: {stats.fairways_hit}% (prioritize fairways over distance)",
+        f"- Scrambling: {stats.short_game.scrambling_percentage}% (short game bailout ability)",
+        f"- 3-putt rate: {stats.putting.three_putts_per_round:.1f}/round (putting pressure tolerance)",
+    ]
+
+    # Add high handicap course management philosophy
+    if handicap >= 20:
+        tail.extend([
+            f"HIGH HANDICAP COURSE MANAGEMENT PRIORITIES:",
+            f"- AVOID DISASTER: Double bogey or worse ruins scores more than birdies help",
+            f"- PLAY FOR BOGEY: Making bogey is often a good result, don't force heroic shots",
+            f"- USE STRONGEST CLUBS: Driver and short irons are most reliable",
+            f"- LAYUP WHEN IN DOUBT: Getting a comfortable next shot often scores better",
+        ])
+
+    # Club distances with course management context
+    key_clubs = [
+        ("driver", stats.club_distances.driver),
+        ("7-iron", stats.club_distances.seven_iron),
+        ("pitching wedge", stats.club_distances.pitching_wedge),
+    ]
+
+    club_distances = ", ".join([f"{club}: {dist}y" for club, dist in key_clubs])
+    tail.extend([
+        f"DISTANCE REALITY CHECK:",
+        f"- {club_distances}",
+        f"- These are TYPICAL distances - recommend taking MORE club in pressure situations",
+        f"- Factor in adrenaline, wind, pin position when choosing",
+    ])
+
+    # Pre-apply the "- " list prefix and join once here, so per-request
+    # assembly concatenates one block instead of re-prefixing ~15 lines.
+    return profile, "\n".join(f"- {part}" for part in tail)
+
+
+def _build_statistics_context(intent: ParsedIntent, handicap: int) -> str:
+    """Build statistics context block for the prompt from a parsed transcript."""
     try:
-        golf_stats = get_golf_statistics()
-        stats = golf_stats.get_stats(handicap)
-        if not stats:
+        static = _static_stats_parts(handicap)
+        if static is None:
             return ""
-        
-        # Parse the transcript to extract distance if mentioned
-        intent = parse_intent(transcript, handicap)
+        profile, static_block = static
+
         distance = intent.distance_yards
-        
-        context_parts = [
-            f"PLAYER SKILL PROFILE: {stats.category} golfer (handicap {handicap})",
-        ]
-        
+
+        context_parts = [f"- {profile}"]
+
         # Show validation warning if present
         if intent.validation_warning:
-            context_parts.append(f"⚠️ REALITY CHECK: {intent.validation_warning}")
-        
+            context_parts.append(f"- ⚠️ REALITY CHECK: {intent.validation_warning}")
+
         # Add distance-specific context if distance is mentioned
         if distance:
+            stats = get_golf_statistics().get_stats(handicap)
             club_rec = stats.club_distances.get_club_for_distance(distance)
             proximity = stats.proximity_to_target.get_expected_proximity(distance)
             gir_pct = stats.greens_in_regulation.get_gir_percentage(distance)
@@ -115,66 +195,250 @@ def _build_statistics_context(transcript: str, handicap: int) -> str:
                     course_mgmt_advice += f" ⚠️ Most {stats.category} players don't carry {club_rec} - consider Driver/3-wood or layup"
             
             context_parts.extend([
-                f"MECHANICAL CLUB RECOMMENDATION for {distance}y: {club_rec}",
-                f"REALISTIC EXPECTATION: {proximity}ft from pin (typical for this handicap)",
-                f"SUCCESS RATE: {gir_pct}% chance of hitting green from {distance}y",
+                f"- MECHANICAL CLUB RECOMMENDATION for {distance}y: {club_rec}",
+                f"- REALISTIC EXPECTATION: {proximity}ft from pin (typical for this handicap)",
+                f"- SUCCESS RATE: {gir_pct}% chance of hitting green from {distance}y",
             ])
-            
+
             if course_mgmt_advice:
-                context_parts.append(course_mgmt_advice)
-        
-        # Course management focused performance data  
-        context_parts.extend([
-            f"PLAYER PERFORMANCE PROFILE:",
-            f"- Overall GIR: {stats.greens_in_regulation.overall}% (play to your average)",
-            f"- Fairways hit: {stats.fairways_hit}% (prioritize fairways over distance)",  
-            f"- Scrambling: {stats.short_game.scrambling_percentage}% (short game bailout ability)",
-            f"- 3-putt rate: {stats.putting.three_putts_per_round:.1f}/round (putting pressure tolerance)",
-        ])
-        
-        # Add high handicap course management philosophy
-        if handicap >= 20:
-            context_parts.extend([
-                f"HIGH HANDICAP COURSE MANAGEMENT PRIORITIES:",
-                f"- AVOID DISASTER: Double bogey or worse ruins scores more than birdies help",
-                f"- PLAY FOR BOGEY: Making bogey is often a good result, don't force heroic shots",
-                f"- USE STRONGEST CLUBS: Driver and short irons are most reliable",
-                f"- LAYUP WHEN IN DOUBT: Getting a comfortable next shot often scores better",
-            ])
-        
-        # Club distances with course management context
-        key_clubs = [
-            ("driver", stats.club_distances.driver),
-            ("7-iron", stats.club_distances.seven_iron),
-            ("pitching wedge", stats.club_distances.pitching_wedge),
-        ]
-        
-        club_distances = ", ".join([f"{club}: {dist}y" for club, dist in key_clubs])
-        context_parts.extend([
-            f"DISTANCE REALITY CHECK:",
-            f"- {club_distances}",
-            f"- These are TYPICAL distances - recommend taking MORE club in pressure situations",
-            f"- Factor in adrenaline, wind, pin position when choosing",
-        ])
-        
-        return "COURSE MANAGEMENT DATA:\n" + "\n".join(f"- {part}" for part in context_parts) + "\n\n"
+                context_parts.append(f"- {course_mgmt_advice}")
+
+        context_parts.append(static_block)
+
+        return "COURSE MANAGEMENT DATA:\n" + "\n".join(context_parts) + "\n\n"
         
     except Exception:
         # Fail gracefully if statistics can't be loaded
         return f"Handicap {handicap} player\n\n"
 
 
-def ask_openai(prompt: str, model: Optional[str] = None):
+_client: OpenAI | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> OpenAI:
+    """Return the shared OpenAI client, creating it lazily (thread-safe).
+
+    Reusing one client keeps the underlying httpx connection pool warm, so
+    repeat calls skip the TCP/TLS handshake.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                api_key = os.getenv("OPENAI_API_KEY")
+                if not api_key:
+                    raise RuntimeError("OPENAI_API_KEY not set")
+                _client = OpenAI(api_key=api_key)
+    return _client
+
+
+def ask_openai_batched(prompts: list[str], model: Optional[str] = None) -> list[str]:
+    """Answer several prompts with ONE chat completion call.
+
+    Coalescing amortizes the fixed RPC and system-prompt token cost across
+    all prompts, which matters for replay/evaluation runs. The model is asked
+    to return a JSON array of {id, reply} objects which is demultiplexed back
+    into a list aligned with `prompts`.
+    """
+    if not prompts:
+        return []
+
+    items = [{"id": i, "prompt": p} for i, p in enumerate(prompts)]
+    instructions = (
+        "Answer each item independently as the caddie. "
+        'Return ONLY a JSON array like [{"id": 0, "reply": "..."}] '
+        "with one entry per item, same ids.\n"
+        f"Items: {json.dumps(items)}"
+    )
+
+    client = _get_client()
+    model_to_use = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    resp = client.chat.completions.create(
+        model=model_to_use,
+        messages=[
+            {"role": "system", "content": _SYSTEM_MESSAGE},
+            {"role": "user", "content": instructions},
+        ],
+        temperature=0.7,
+        max_tokens=180 * len(prompts),
+    )
+    text = resp.choices[0].message.content or ""
+    try:
+        replies = {int(item["id"]): str(item["reply"]) for item in json.loads(text)}
+    except (ValueError, TypeError, KeyError) as e:
+        raise RuntimeError(f"Unparseable batched reply: {e}")
+    return [replies.get(i, "") for i in range(len(prompts))]
+
+
+async def ask_openai_many(prompts: list[str], model: Optional[str] = None,
+                          concurrency: int = 8, max_retries: int = 3) -> list[str]:
+    """Answer prompts concurrently with AsyncOpenAI, throttled by a semaphore.
+
+    Sequential per-prompt calls are the bottleneck when scoring many
+    transcripts; this overlaps the network waits while capping in-flight
+    requests at `concurrency`. Rate-limited calls back off exponentially.
+    """
+    if not prompts:
+        return []
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY not set")
+
+    client = AsyncOpenAI(api_key=api_key)
+    model_to_use = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(prompt: str) -> str:
+        async with sem:
+            for attempt in range(max_retries + 1):
+                try:
+                    resp = await client.chat.completions.create(
+                        model=model_to_use,
+                        messages=[
+                            {"role": "system", "content": _SYSTEM_MESSAGE},
+                            {"role": "user", "content": prompt},
+                        ],
+                        temperature=0.7,
+                        max_tokens=180,
+                    )
+                    return resp.choices[0].message.content or ""
+                except RateLimitError:
+                    if attempt == max_retries:
+                        raise
+                    await asyncio.sleep(2 ** attempt)
+
+    return list(await asyncio.gather(*(one(p) for p in prompts)))
+
+
+def ask_openai_batch(prompts: list[str], model: Optional[str] = None,
+                     poll_interval_sec: float = 30.0) -> list[str]:
+    """Submit prompts to the OpenAI Batch API and return aligned replies.
+
+    Meant for offline/bulk workloads (regression runs, prompt tuning,
+    replaying logged rounds) where latency doesn't matter: batches run at
+    reduced cost with provider-side parallelism but can take minutes to
+    hours. Blocks while polling for completion.
+    """
+    if not prompts:
+        return []
+
+    client = _get_client()
+    model_to_use = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+
+    lines = []
+    for i, prompt in enumerate(prompts):
+        lines.append(json.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model_to_use,
+                "messages": [
+                    {"role": "system", "content": _SYSTEM_MESSAGE},
+                    {"role": "user", "content": prompt},
+                ],
+                "temperature": 0.7,
+                "max_tokens": 180,
+            },
+        }))
+
+    batch_file = client.files.create(
+        file=("batch.jsonl", "\n".join(lines).encode()),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(poll_interval_sec)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+    replies = [""] * len(prompts)
+    output = client.files.content(batch.output_file_id)
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        idx = int(record["custom_id"])
+        body = record.get("response", {}).get("body", {})
+        choices = body.get("choices") or []
+        if choices:
+            replies[idx] = choices[0].get("message", {}).get("content") or ""
+    return replies
+
+
+def ask_openai_stream(prompt: str, model: Optional[str] = None):
+    """Yield the reply incrementally as tokens arrive.
+
+    ask_openai blocks for the full generation (1-3s for a typical reply);
+    streaming lets callers start rendering or speaking at time-to-first-
+    token instead. Yields text chunks; join them for the full reply.
+    """
+    client = _get_client()
+    model_to_use = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    stream = client.chat.completions.create(
+        model=model_to_use,
+        messages=[
+            {"role": "system", "content": _SYSTEM_MESSAGE},
+            {"role": "user", "content": prompt},
+        ],
+        temperature=0.7,
+        max_tokens=180,
+        stream=True,
+    )
+    for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            yield delta
+
+
+def ask_openai(prompt: str, model: Optional[str] = None, *, use_cache: bool = False):
+    """Ask the caddie model one question, returning (text, meta).
+
+    With use_cache=True, identical (prompt, model) pairs are served from an
+    in-process LRU keyed on a blake2b digest of both, skipping the network
+    entirely. Only opt in where replaying the same answer is acceptable
+    (test runs, replayed transcripts) — completions are sampled, so a cache
+    hit pins the first response.
+    """
+    if use_cache:
+        h = hashlib.blake2b(f"{model or ''}\x00{prompt}".encode(), digest_size=16).digest()
+        hit = _ANSWER_CACHE.get(h)
+        if hit is not None:
+            _ANSWER_CACHE.move_to_end(h)
+            return hit
+        result = _ask_openai_uncached(prompt, model)
+        _ANSWER_CACHE[h] = result
+        if len(_ANSWER_CACHE) > _ANSWER_CACHE_MAXSIZE:
+            _ANSWER_CACHE.popitem(last=False)
+        return result
+    return _ask_openai_uncached(prompt, model)
+
+
+# Keyed on the 16-byte digest alone so the cache retains no prompt text;
+# bounded LRU like the wind cache in weather.py.
+_ANSWER_CACHE: OrderedDict[bytes, tuple] = OrderedDict()
+_ANSWER_CACHE_MAXSIZE = 512
+
+
+def _ask_openai_uncached(prompt: str, model: Optional[str]):
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY not set")
 
-    client = OpenAI(api_key=api_key)
+    client = _get_client()
     model_to_use = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     resp = client.chat.completions.create(
         model=model_to_use,
         messages=[
-            {"role": "system", "content": "You are a witty golf caddie."},
+            {"role": "system", "content": _SYSTEM_MESSAGE},
             {"role": "user", "content": prompt},
         ],
         temperature=0.7,
@@ -1,59 +1,140 @@
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
+
+from .statistics import get_golf_statistics
 
 
 LIES = ["fairway", "rough", "sand", "bunker", "tee"]
 HAZARDS = ["water", "bunker", "trees", "woods", "pond"]
 
-
-@dataclass
+# One fused scan finds every lie/hazard keyword present instead of a
+# separate substring pass per keyword.
+_LIE_HAZ_RE = re.compile("|".join(re.escape(w) for w in dict.fromkeys(LIES + HAZARDS)))
+
+
+# All patterns are compiled once at import; parse_intent runs per transcript.
+
+# distance like "150 yards" or "150y" or "at 150"
+# BUT avoid matching numbers that are part of handicap mentions.
+# The three forms are fused into one alternation so a transcript is
+# scanned once; dispatch below keeps the original per-form precedence.
+_DISTANCE_RE = re.compile(
+    r"(?P<yard>\d{2,3})\s*(?:yard|yards|y|yd|yds)\b"  # Require yard-related suffix
+    r"|\bat\s+(?P<at>\d{2,3})\b"  # "at 150"
+    r"|(?P<par>\d{2,3})\s*(?:yard|yards)\s+(?:par|hole)"  # "161 yard par three"
+)
+_DISTANCE_GROUP_ORDER = ("yard", "at", "par")
+
+# Word to number mapping for spoken club numbers
+_CLUB_WORD_TO_NUM = {'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9}
+
+# Word to number mapping for spoken handicap numbers
+_HCP_WORD_TO_NUM = {
+    'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
+    'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
+    'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20,
+    'scratch': 0
+}
+
+_HCP_WORDS_PAT = "|".join(w for w in _HCP_WORD_TO_NUM if w != "scratch")
+
+# Club and handicap families are each fused into ONE alternation regex with
+# named groups, so a transcript is scanned once per family rather than once
+# per pattern. Groups are listed most-specific first; dispatch picks the
+# match whose group has the highest priority (lowest index below).
+_CLUB_RE = re.compile(
+    r"\b(?P<driver>driver|drive)\b"
+    r"|\b(?P<wood>(?:\d+|three|four|five|six|seven|eight|nine)\s*wood)\b"
+    r"|\b(?P<iron>(?:\d+|three|four|five|six|seven|eight|nine)\s*iron)\b"
+    r"|\b(?P<pw>pitching\s*wedge|pw)\b"
+    r"|\b(?P<sw>sand\s*wedge|sw)\b"
+    r"|\b(?P<lw>lob\s*wedge|lw)\b"
+    r"|\b(?P<gw>gap\s*wedge|gw)\b"
+    r"|\b(?P<wedge>wedge)\b"
+    r"|\b(?P<putter>putter|putt)\b"
+)
+_CLUB_GROUP_PRIORITY = {
+    name: i for i, name in enumerate(("driver", "wood", "iron", "pw", "sw", "lw", "gw", "wedge", "putter"))
+}
+
+_HANDICAP_RE = re.compile(
+    r"\b(?P<im_hcp>i'?m\s+a\s+(?:-?\d{1,2}|" + _HCP_WORDS_PAT + r")\s+handicap)\b"
+    r"|\b(?P<my_hcp>my\s+handicap\s+is\s+(?:\d{1,2}|" + _HCP_WORDS_PAT + r"))\b"
+    r"|\b(?P<player>\d{1,2}\s+handicap\s+player)\b"
+    r"|\b(?P<hcp_n>handicap\s+(?:\d{1,2}|" + _HCP_WORDS_PAT + r"))\b"
+    r"|\b(?P<play_to>i\s+play\s+to\s+(?:a\s+)?\d{1,2})\b"
+    r"|\b(?P<im_n>i'?m\s+a\s+(?:\d{1,2}|" + _HCP_WORDS_PAT + r"))\b"  # Less specific but common
+    r"|\b(?P<scratch>scratch\s+(?:golfer|player))\b"  # Special case for scratch
+)
+_HCP_GROUP_PRIORITY = {
+    name: i for i, name in enumerate(("im_hcp", "my_hcp", "player", "hcp_n", "play_to", "im_n", "scratch"))
+}
+
+_DIGIT_RE = re.compile(r"(\d+)")
+_SIGNED_INT_RE = re.compile(r"-?\d{1,2}")
+
+# Cheap prefilter: every distance pattern requires a digit
+_HAS_DIGIT = re.compile(r"\d").search
+
+
+@dataclass(slots=True, frozen=True)
 class ParsedIntent:
     distance_yards: Optional[int]
     lie: str
-    hazards: List[str]
+    hazards: Tuple[str, ...]
     club_mentioned: Optional[str] = None
     validation_warning: Optional[str] = None
     handicap_mentioned: Optional[int] = None
 
 
-def parse_intent(text: str, handicap: Optional[int] = None) -> ParsedIntent:
-    text_l = text.lower()
-    
+def parse_intent(text: str, handicap: Optional[int] = None, *, text_l: Optional[str] = None) -> ParsedIntent:
+    # Callers that already lowercased the transcript (e.g. the CLI loop,
+    # which classifies intent from the same string) can pass it in.
+    # Parsing only ever looks at the lowercased text, so the memoized
+    # worker is keyed on that plus the handicap.
+    if text_l is None:
+        text_l = text.lower()
+    return _parse_intent_cached(text_l, handicap)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_intent_cached(text_l: str, handicap: Optional[int]) -> ParsedIntent:
     # Extract handicap first to avoid confusion with distance
     handicap_mentioned = _extract_handicap_mention(text_l)
     
-    # distance like "150 yards" or "150y" or "at 150" 
-    # BUT avoid matching numbers that are part of handicap mentions
     distance = None
-    distance_patterns = [
-        r"(\d{2,3})\s*(?:yard|yards|y|yd|yds)\b",  # Require yard-related suffix
-        r"\bat\s+(\d{2,3})\b",  # "at 150"  
-        r"(\d{2,3})\s*(?:yard|yards)\s+(?:par|hole)",  # "161 yard par three"
-    ]
-    
-    for pattern in distance_patterns:
-        m = re.search(pattern, text_l)
-        if m:
-            potential_distance = int(m.group(1))
+    if _HAS_DIGIT(text_l):
+        # One pass collects the first hit per form; precedence then mirrors
+        # the old one-regex-at-a-time ordering.
+        first_hits: dict = {}
+        for m in _DISTANCE_RE.finditer(text_l):
+            first_hits.setdefault(m.lastgroup, int(m.group(m.lastgroup)))
+        for group in _DISTANCE_GROUP_ORDER:
+            potential_distance = first_hits.get(group)
             # Avoid distances that are likely handicaps (under 36)
-            if potential_distance > 36:  # Reasonable minimum golf shot distance
+            if potential_distance is not None and potential_distance > 36:
                 distance = potential_distance
                 break
 
+    keyword_hits = {m.group(0) for m in _LIE_HAZ_RE.finditer(text_l)}
+
     lie = "fairway"
     for cand in LIES:
-        if cand in text_l:
+        if cand in keyword_hits:
             # map bunker to sand
             lie = "sand" if cand in {"sand", "bunker"} else cand
             break
 
-    hazards: List[str] = []
-    for hz in HAZARDS:
-        if hz in text_l and (hz != lie):
-            hazards.append(hz if hz != "bunker" else "front_bunker")
+    hazards: Tuple[str, ...] = tuple(
+        hz if hz != "bunker" else "front_bunker"
+        for hz in HAZARDS
+        if hz in keyword_hits and (hz != lie)
+    )
 
     # Extract club mentions
     club_mentioned = _extract_club_mention(text_l)
@@ -76,117 +157,77 @@ def parse_intent(text: str, handicap: Optional[int] = None) -> ParsedIntent:
     )
 
 
+def _best_match(regex: re.Pattern, priority: dict, text_l: str) -> Optional[re.Match]:
+    """One pass over the text; return the match whose group is most specific."""
+    best: Optional[re.Match] = None
+    best_prio = len(priority)
+    for m in regex.finditer(text_l):
+        prio = priority[m.lastgroup]
+        if prio < best_prio:
+            best, best_prio = m, prio
+            if prio == 0:
+                break
+    return best
+
+
 def _extract_club_mention(text_l: str) -> Optional[str]:
     """Extract club mentions from text."""
-    # Club patterns to look for (including word numbers)
-    club_patterns = [
-        r"\b(driver|drive)\b",
-        r"\b(\d+)\s*wood\b",
-        r"\b(three|four|five|six|seven|eight|nine)\s*wood\b",
-        r"\b(\d+)\s*iron\b", 
-        r"\b(three|four|five|six|seven|eight|nine)\s*iron\b",
-        r"\b(pitching\s*wedge|pw)\b",
-        r"\b(sand\s*wedge|sw)\b",
-        r"\b(lob\s*wedge|lw)\b",
-        r"\b(gap\s*wedge|gw)\b",
-        r"\b(wedge)\b",
-        r"\b(putter|putt)\b",
-    ]
-    
-    # Word to number mapping for clubs
-    word_to_num = {'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9}
-    
-    for pattern in club_patterns:
-        match = re.search(pattern, text_l)
-        if match:
-            # Normalize club names
-            full_match = match.group(0)
-            if "driver" in full_match or "drive" in full_match:
-                return "driver"
-            elif "wood" in full_match:
-                # Check for word numbers first
-                for word, num in word_to_num.items():
-                    if word in full_match:
-                        return f"{num}-wood"
-                # Fall back to digit
-                number = re.search(r"(\d+)", full_match)
-                return f"{number.group(1)}-wood" if number else "3-wood"
-            elif "iron" in full_match:
-                # Check for word numbers first  
-                for word, num in word_to_num.items():
-                    if word in full_match:
-                        return f"{num}-iron"
-                # Fall back to digit
-                number = re.search(r"(\d+)", full_match)
-                return f"{number.group(1)}-iron" if number else "7-iron"
-            elif "pitching" in full_match or "pw" in full_match:
-                return "pitching-wedge"
-            elif "sand" in full_match or "sw" in full_match:
-                return "sand-wedge"
-            elif "lob" in full_match or "lw" in full_match:
-                return "lob-wedge"
-            elif "gap" in full_match or "gw" in full_match:
-                return "gap-wedge"
-            elif "wedge" in full_match:
-                return "pitching-wedge"  # Default wedge
-            elif "putter" in full_match or "putt" in full_match:
-                return "putter"
-    
-    return None
+    match = _best_match(_CLUB_RE, _CLUB_GROUP_PRIORITY, text_l)
+    if match is None:
+        return None
+
+    # Normalize club names
+    group = match.lastgroup
+    full_match = match.group(0)
+    if group == "driver":
+        return "driver"
+    elif group in ("wood", "iron"):
+        # Check for word numbers first
+        for word, num in _CLUB_WORD_TO_NUM.items():
+            if word in full_match:
+                return f"{num}-{group}"
+        # Fall back to digit
+        number = _DIGIT_RE.search(full_match)
+        default = "3-wood" if group == "wood" else "7-iron"
+        return f"{number.group(1)}-{group}" if number else default
+    elif group == "pw":
+        return "pitching-wedge"
+    elif group == "sw":
+        return "sand-wedge"
+    elif group == "lw":
+        return "lob-wedge"
+    elif group == "gw":
+        return "gap-wedge"
+    elif group == "wedge":
+        return "pitching-wedge"  # Default wedge
+    else:
+        return "putter"
 
 
 def _extract_handicap_mention(text_l: str) -> Optional[int]:
     """Extract handicap mentions from text."""
-    # Word to number mapping for spoken numbers
-    word_to_num = {
-        'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-        'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
-        'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
-        'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20,
-        'scratch': 0
-    }
-    
-    # Handicap patterns - both digits and words
-    handicap_patterns = [
-        r"\bi'?m\s+a\s+(\d{1,2})\s+handicap\b",
-        r"\bi'?m\s+a\s+(zero|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty)\s+handicap\b",
-        r"\bmy\s+handicap\s+is\s+(\d{1,2})\b",
-        r"\bmy\s+handicap\s+is\s+(zero|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty)\b",
-        r"\b(\d{1,2})\s+handicap\s+player\b",
-        r"\bhandicap\s+(\d{1,2})\b",
-        r"\bhandicap\s+(zero|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty)\b",
-        r"\bi\s+play\s+to\s+a?\s+(\d{1,2})\b",
-        r"\bi'?m\s+a\s+(\d{1,2})\b",  # Less specific but common
-        r"\bi'?m\s+a\s+(zero|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty)\b",
-        r"\bscratch\s+golfer\b",  # Special case for scratch
-        r"\bscratch\s+player\b",
-    ]
-    
-    for pattern in handicap_patterns:
-        match = re.search(pattern, text_l)
-        if match:
-            if "scratch" in pattern:
-                return 0
-            try:
-                matched_text = match.group(1)
-                # Try to convert word to number first
-                if matched_text in word_to_num:
-                    handicap = word_to_num[matched_text]
-                else:
-                    # Fall back to digit parsing
-                    handicap = int(matched_text)
-                # Clamp to reasonable range
-                return max(0, min(30, handicap))
-            except (ValueError, IndexError):
-                continue
-    
-    return None
+    match = _best_match(_HANDICAP_RE, _HCP_GROUP_PRIORITY, text_l)
+    if match is None:
+        return None
+    if match.lastgroup == "scratch":
+        return 0
+
+    full_match = match.group(0)
+    # Try digits first, then spoken number words
+    number = _SIGNED_INT_RE.search(full_match)
+    if number:
+        handicap = int(number.group(0))
+    else:
+        handicap = next((_HCP_WORD_TO_NUM[tok] for tok in full_match.split() if tok in _HCP_WORD_TO_NUM), None)
+        if handicap is None:
+            return None
+    # Clamp to reasonable range
+    return max(0, min(30, handicap))
 
 
 def _validate_distance_club_combination(handicap: int, club: str, distance: int) -> Optional[str]:
     """Validate if distance/club combination is realistic for handicap."""
     try:
-        from .statistics import get_golf_statistics
         golf_stats = get_golf_statistics()
         is_valid, reason = golf_stats.validate_distance_claim(handicap, club, distance)
         return None if is_valid else reason
@@ -3,34 +3,67 @@
 from __future__ import annotations
 
 import asyncio
-import os
-from typing import Optional, Callable, Any
+import atexit
+import concurrent.futures
+import functools
+from typing import Optional, Callable
 from dataclasses import dataclass
 
+import numpy as np
+
 from pipecat.frames.frames import (
+    AudioRawFrame,
     Frame,
     TranscriptionFrame,
     InterimTranscriptionFrame,
-    UserStartedSpeakingFrame,
-    UserStoppedSpeakingFrame,
-    StartFrame,
-    EndFrame,
 )
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineTask
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
 from pipecat.services.speechmatics.stt import SpeechmaticsSTTService
+from pipecat.transcriptions.language import Language
 from pipecat.transports.local.audio import LocalAudioTransport, LocalAudioTransportParams
 import pyaudio
 
 from .tts import speak as speechmatics_speak
 from loguru import logger
 
+# Frame types checked on every frame in process_frame; bound once here.
+_TRANSCRIPT_TYPES = (TranscriptionFrame, InterimTranscriptionFrame)
+
+
+@functools.cache
+def _get_pyaudio() -> pyaudio.PyAudio:
+    """Shared PyAudio instance; Pa_Initialize walks every host API, so pay
+    that once per process instead of per pipeline start. Terminated at exit.
+    """
+    p = pyaudio.PyAudio()
+    atexit.register(p.terminate)
+    return p
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_device_index(name: str) -> Optional[int]:
+    """Resolve an input device index by name substring, memoized.
 
-@dataclass
+    PortAudio device enumeration rescans every host API (tens of ms), so
+    the result is cached per name across pipeline restarts.
+    """
+    p = _get_pyaudio()
+    name_l = name.lower()
+    for i in range(p.get_device_count()):
+        info = p.get_device_info_by_index(i)
+        if name_l in info.get("name", "").lower() and info.get("maxInputChannels", 0) > 0:
+            return i
+    return None
+
+
+@dataclass(frozen=True, slots=True)
 class PipelineConfig:
-    """Configuration for the Pipecat pipeline."""
+    """Configuration for the Pipecat pipeline. Frozen and slotted: attribute
+    reads skip the instance __dict__ and instances are hashable, so a config
+    can key caches (e.g. pipeline reuse across restarts)."""
     api_key: str
     language: str = "en"
     sample_rate: int = 16000
@@ -41,31 +74,135 @@ class GolfCaddieProcessor(FrameProcessor):
     """Minimal processor that captures transcription frames."""
     
     def __init__(
-        self, 
+        self,
         on_transcript: Optional[Callable[[str, bool], None]] = None,
+        callback_ref: Optional[Callable[[], Optional[Callable[[str, bool], None]]]] = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self._on_transcript = on_transcript
-    
+        # The callback is resolved through a zero-arg getter at dispatch
+        # time, so the pipeline owner can swap callbacks via set_callbacks
+        # without rebuilding the (cached) pipeline. A plain callback is
+        # still accepted and wrapped for direct users.
+        self._get_cb = callback_ref if callback_ref is not None else (lambda: on_transcript)
+        # Interim transcripts are coalesced: only the newest one within the
+        # debounce window reaches the callback (see process_frame).
+        self._pending_interim: Optional[str] = None
+        self._interim_handle: Optional[asyncio.TimerHandle] = None
+        # Callbacks run on a dedicated consumer task fed by this bounded
+        # queue, so a slow handler can't stall frame processing (see _emit).
+        self._out_q: asyncio.Queue[tuple[str, bool]] = asyncio.Queue(maxsize=64)
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    # Interims can arrive many times per second and each is superseded within
+    # tens of ms; delivering at most one per window keeps the callback (UI,
+    # CLI echo) from being hammered without losing the latest text.
+    _INTERIM_FLUSH_SEC = 0.05
+
+    def _flush_interim(self):
+        self._interim_handle = None
+        text, self._pending_interim = self._pending_interim, None
+        if text:
+            self._emit(text, False)
+
+    def _emit(self, text: str, is_final: bool):
+        """Queue a transcript for the dispatcher task.
+
+        Finals displace the oldest queued item when the queue is full;
+        interims are best-effort and simply dropped under backlog.
+        """
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch_loop())
+        try:
+            self._out_q.put_nowait((text, is_final))
+        except asyncio.QueueFull:
+            if is_final:
+                try:
+                    self._out_q.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                self._out_q.put_nowait((text, is_final))
+
+    async def _dispatch_loop(self):
+        while True:
+            text, is_final = await self._out_q.get()
+            cb = self._get_cb()
+            if cb is not None:
+                try:
+                    cb(text, is_final)
+                except Exception as e:
+                    logger.error("Transcript callback error: {}", e)
+
+    async def cleanup(self):
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        await super().cleanup()
+
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         """Process frames - capture transcripts and pass through."""
 
         # IMPORTANT: let base class handle StartFrame/system frames first
         await super().process_frame(frame, direction)
 
-        # Capture STT frames only
-        if isinstance(frame, TranscriptionFrame):
-            if self._on_transcript and getattr(frame, "text", None):
-                self._on_transcript(frame.text, True)
-        elif isinstance(frame, InterimTranscriptionFrame):
-            if self._on_transcript and getattr(frame, "text", None):
-                self._on_transcript(frame.text, False)
+        # Capture STT frames only; skip all per-frame work when nobody is
+        # listening, and gate both frame types with a single isinstance.
+        cb = self._get_cb()
+        if cb is not None and isinstance(frame, _TRANSCRIPT_TYPES):
+            text = frame.text
+            if text:
+                if isinstance(frame, TranscriptionFrame):
+                    # Finals flush immediately and drop any stale interim.
+                    if self._interim_handle is not None:
+                        self._interim_handle.cancel()
+                        self._interim_handle = None
+                    self._pending_interim = None
+                    self._emit(text, True)
+                else:
+                    self._pending_interim = text
+                    if self._interim_handle is None:
+                        self._interim_handle = asyncio.get_running_loop().call_later(
+                            self._INTERIM_FLUSH_SEC, self._flush_interim
+                        )
 
         # Pass frame along
         await self.push_frame(frame, direction)
 
 
+class SilenceGateProcessor(FrameProcessor):
+    """Drops sustained-silence audio before it reaches the STT service.
+
+    Speechmatics is billed and latency-bound per chunk sent; most of a golf
+    round is silence. Chunk RMS is computed with one vectorized NumPy pass
+    over the int16 samples, and frames are only dropped after the signal has
+    stayed below threshold for `hangover_chunks` in a row, so speech onsets
+    and trailing words are never clipped.
+    """
+
+    def __init__(self, threshold_rms: float = 200.0, hangover_chunks: int = 25, **kwargs):
+        super().__init__(**kwargs)
+        self._threshold = threshold_rms
+        self._hangover = hangover_chunks
+        self._quiet_run = 0
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, AudioRawFrame):
+            samples = np.frombuffer(frame.audio, dtype=np.int16)
+            if samples.size:
+                x = samples.astype(np.float32)
+                rms = float(np.sqrt(np.dot(x, x) / x.size))
+                if rms < self._threshold:
+                    self._quiet_run += 1
+                    if self._quiet_run > self._hangover:
+                        return  # sustained silence: don't forward to STT
+                else:
+                    self._quiet_run = 0
+
+        await self.push_frame(frame, direction)
+
+
 class PipecatGolfPipeline:
     """Pipecat-based golf caddie pipeline with Speechmatics STT."""
     
@@ -79,7 +216,13 @@ class PipecatGolfPipeline:
         self._stt_service: Optional[SpeechmaticsSTTService] = None
         self._processor: Optional[GolfCaddieProcessor] = None
         self._audio_transport: Optional[LocalAudioTransport] = None
-        
+        self._tts_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+        # Warm pipeline reused across start/stop cycles (push-to-talk UIs
+        # cycle frequently); rebuilt only if the config was swapped out.
+        self._cached_pipeline: Optional[Pipeline] = None
+        self._cached_config: Optional[PipelineConfig] = None
+
     def set_callbacks(
         self,
         on_transcript: Optional[Callable[[str, bool], None]] = None,
@@ -89,10 +232,8 @@ class PipecatGolfPipeline:
         
     async def _create_pipeline(self) -> Pipeline:
         """Create and configure the Pipecat pipeline."""
-        
-        # CRITICAL: enable_partials=True is REQUIRED for real-time transcription!
-        from pipecat.transcriptions.language import Language
 
+        # CRITICAL: enable_partials=True is REQUIRED for real-time transcription!
         # Configure Speechmatics STT service with optimized settings for natural speech
         self._stt_service = SpeechmaticsSTTService(
             api_key=self.config.api_key,
@@ -102,7 +243,7 @@ class PipecatGolfPipeline:
                 language=Language.EN,
                 enable_partials=True,
                 max_delay=3.0,  # Allow 3 seconds for natural speech pauses
-                chunk_size=160, # Keep chunk size small for responsiveness
+                chunk_size=640, # 40ms chunks: 4x fewer websocket sends than 160, partials still prompt
                 enable_vad=True,  # Use Voice Activity Detection for better speech boundary detection
                 # end_of_utterance_silence_trigger=3.0,  # Temporarily disabled - may be causing connection issues
             )
@@ -118,15 +259,9 @@ class PipecatGolfPipeline:
                 input_device_index = int(self.config.device)
             except (TypeError, ValueError):
                 try:
-                    p = pyaudio.PyAudio()
-                    for i in range(p.get_device_count()):
-                        info = p.get_device_info_by_index(i)
-                        name = info.get("name", "")
-                        if self.config.device.lower() in name.lower() and info.get("maxInputChannels", 0) > 0:
-                            input_device_index = i
-                            break
+                    input_device_index = _resolve_device_index(self.config.device)
                 except Exception as _e:
-                    logger.warning(f"Could not resolve device '{self.config.device}': {_e}")
+                    logger.warning("Could not resolve device '{}': {}", self.config.device, _e)
 
         # Create audio transport using LocalAudioTransportParams
         transport_params = LocalAudioTransportParams(
@@ -139,21 +274,18 @@ class PipecatGolfPipeline:
         self._audio_transport = LocalAudioTransport(params=transport_params)
 
         # Add a processor after STT to capture outgoing transcription frames
-        self._processor = GolfCaddieProcessor(on_transcript=self._on_transcript)
+        self._processor = GolfCaddieProcessor(callback_ref=lambda: self._on_transcript)
 
-        # Build pipeline: mic -> STT -> processor
+        # Build pipeline: mic -> silence gate -> STT -> processor
         pipeline = Pipeline([
             self._audio_transport.input(),
+            SilenceGateProcessor(),
             self._stt_service,
             self._processor,
         ])
         
         return pipeline
     
-    def _install_transcript_hook(self):
-        """Deprecated: previously hooked internal methods; no longer used."""
-        logger.debug("Transcript hook not used; processor captures frames downstream.")
-        
     async def start(self):
         """Start the pipeline."""
         if self._runner is not None:
@@ -161,40 +293,72 @@ class PipecatGolfPipeline:
             return
             
         try:
-            pipeline = await self._create_pipeline()
-            
+            if self._cached_pipeline is not None and self._cached_config == self.config:
+                pipeline = self._cached_pipeline
+            else:
+                pipeline = await self._create_pipeline()
+                self._cached_pipeline = pipeline
+                self._cached_config = self.config
+
             self._task = PipelineTask(pipeline)
             self._runner = PipelineRunner()
             
             logger.info("Starting Pipecat pipeline with Speechmatics STT/TTS")
             await self._runner.run(self._task)
-            
+
+        except asyncio.CancelledError:
+            # Normal shutdown path: propagate without logging an error or
+            # paying for exception formatting on cancel.
+            raise
         except Exception as e:
-            logger.error(f"Failed to start pipeline: {e}")
+            logger.error("Failed to start pipeline: {}", e)
             raise
             
+    # How long stop() waits for a graceful runner shutdown before force-
+    # cancelling the task (a stuck websocket close would otherwise hang us).
+    _STOP_TIMEOUT_SEC = 2.0
+
     async def stop(self):
-        """Stop the pipeline."""
+        """Stop the pipeline, force-cancelling if graceful shutdown hangs."""
         if self._runner is None:
             return
-            
+
         try:
             logger.info("Stopping Pipecat pipeline")
-            await self._runner.stop()
+            await asyncio.wait_for(self._runner.stop(), timeout=self._STOP_TIMEOUT_SEC)
+        except asyncio.TimeoutError:
+            logger.warning("Pipeline stop timed out after {}s; cancelling task", self._STOP_TIMEOUT_SEC)
+            if self._task is not None:
+                try:
+                    await asyncio.wait_for(self._task.cancel(), timeout=1.0)
+                except Exception as e:
+                    logger.error("Error cancelling pipeline task: {}", e)
+        except Exception as e:
+            logger.error("Error stopping pipeline: {}", e)
+        finally:
             self._runner = None
             self._task = None
-            
-        except Exception as e:
-            logger.error(f"Error stopping pipeline: {e}")
-            
+            if self._tts_executor is not None:
+                self._tts_executor.shutdown(wait=False)
+                self._tts_executor = None
+
     async def speak(self, text: str):
         """Send text to TTS using original Speechmatics implementation."""
         try:
-            # Use the original Speechmatics TTS implementation
-            await asyncio.to_thread(speechmatics_speak, text)
-            
+            # Run blocking TTS on a dedicated single worker rather than the
+            # default to_thread executor: no thread churn under bursts, and
+            # utterances are serialized so the Speechmatics client is never
+            # entered reentrantly.
+            if self._tts_executor is None:
+                self._tts_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="tts"
+                )
+            await asyncio.get_running_loop().run_in_executor(
+                self._tts_executor, speechmatics_speak, text
+            )
+
         except Exception as e:
-            logger.error(f"TTS error: {e}")
+            logger.error("TTS error: {}", e)
             
     def is_running(self) -> bool:
         """Check if pipeline is running."""
@@ -208,8 +372,10 @@ class MockPipecatPipeline:
         self.events = events
         self._on_transcript: Optional[Callable[[str, bool], None]] = None
         self._running = False
-        self._task: Optional[asyncio.Task] = None
-        
+        self._handles: list[asyncio.TimerHandle] = []
+        self._done: Optional[asyncio.Event] = None
+        self._pending = 0
+
     def set_callbacks(
         self,
         on_transcript: Optional[Callable[[str, bool], None]] = None,
@@ -218,44 +384,56 @@ class MockPipecatPipeline:
         self._on_transcript = on_transcript
         
     async def start(self):
-        """Start the mock pipeline."""
+        """Start the mock pipeline.
+
+        The whole event timeline is scheduled up front with loop.call_at
+        (one timer per event at the usual 0.1s cadence) instead of a task
+        that sleeps between events, so delivery cost doesn't grow with a
+        per-event context switch and long event lists are cheap to replay.
+        """
         if self._running:
             return
-            
+
         self._running = True
-        self._task = asyncio.create_task(self._run_mock_events())
-        
+        self._done = asyncio.Event()
+        self._pending = len(self.events)
+        if self._pending == 0:
+            self._done.set()
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        self._handles = [
+            loop.call_at(t0 + 0.1 * (i + 1), self._dispatch, text, event_type == "final")
+            for i, (event_type, text, _timestamp) in enumerate(self.events)
+        ]
+
+    def _dispatch(self, text: str, is_final: bool):
+        """Deliver one scheduled event, honoring stop() and late callbacks."""
+        if self._running and self._on_transcript:
+            self._on_transcript(text, is_final)
+        self._pending -= 1
+        if self._pending <= 0 and self._done is not None:
+            self._done.set()
+
+    async def wait_until_drained(self, timeout: float = 1.0):
+        """Block until every scheduled event has been delivered.
+
+        Lets tests wait exactly as long as delivery takes instead of
+        sleeping a fixed worst-case interval.
+        """
+        if self._done is not None:
+            await asyncio.wait_for(self._done.wait(), timeout)
+
     async def stop(self):
-        """Stop the mock pipeline."""
+        """Stop the mock pipeline and cancel any undelivered events."""
         self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
-            
+        for handle in self._handles:
+            handle.cancel()
+        self._handles = []
+
     async def speak(self, text: str):
         """Mock speak method."""
-        logger.info(f"Mock TTS: {text}")
+        logger.info("Mock TTS: {}", text)
         
     def is_running(self) -> bool:
         """Check if mock pipeline is running."""
-        return self._running
-        
-    async def _run_mock_events(self):
-        """Run mock transcription events."""
-        try:
-            for event_type, text, timestamp in self.events:
-                if not self._running:
-                    break
-                    
-                await asyncio.sleep(0.1)  # Simulate processing time
-                
-                if self._on_transcript:
-                    is_final = event_type == "final"
-                    self._on_transcript(text, is_final)
-                    
-        except asyncio.CancelledError:
-            pass
\ No newline at end of file
+        return self._running
\ No newline at end of file
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+from dataclasses import dataclass, field
 from typing import Dict, Optional, Any
 from pathlib import Path
 
 
-@dataclass
+@functools.lru_cache(maxsize=64)
+def _club_attr_name(club: str) -> str:
+    """Normalize a spoken club name to a ClubDistances attribute name.
+
+    Memoized because validation re-normalizes the same handful of club
+    strings on every parsed transcript.
+    """
+    return club.lower().replace("-", "_").replace(" ", "_")
+
+
+@dataclass(frozen=True, slots=True)
 class ClubDistances:
     """Expected distances for each club by handicap."""
     driver: int
@@ -25,6 +39,8 @@ class ClubDistances:
     pitching_wedge: int
     sand_wedge: int
     lob_wedge: int
+    _sorted_names: tuple = field(init=False, repr=False, compare=False)
+    _sorted_dists: np.ndarray = field(init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, int]) -> 'ClubDistances':
@@ -45,40 +61,41 @@ class ClubDistances:
             lob_wedge=data["lob_wedge"],
         )
 
-    def get_club_for_distance(self, target_distance: int) -> str:
-        """Find the most appropriate club for a given distance."""
-        clubs = [
-            ("lob_wedge", self.lob_wedge),
-            ("sand_wedge", self.sand_wedge),
-            ("pitching_wedge", self.pitching_wedge),
-            ("9_iron", self.nine_iron),
-            ("8_iron", self.eight_iron),
-            ("7_iron", self.seven_iron),
-            ("6_iron", self.six_iron),
-            ("5_iron", self.five_iron),
-            ("4_iron", self.four_iron),
-            ("3_iron", self.three_iron),
-            ("5_wood", self.five_wood),
-            ("3_wood", self.three_wood),
+    def __post_init__(self):
+        # Clubs sorted ascending by distance, precomputed once so the
+        # per-call lookup is a single binary search with no allocation.
+        # Names are stored pre-hyphenated (the output format).
+        pairs = sorted([
+            ("lob-wedge", self.lob_wedge),
+            ("sand-wedge", self.sand_wedge),
+            ("pitching-wedge", self.pitching_wedge),
+            ("9-iron", self.nine_iron),
+            ("8-iron", self.eight_iron),
+            ("7-iron", self.seven_iron),
+            ("6-iron", self.six_iron),
+            ("5-iron", self.five_iron),
+            ("4-iron", self.four_iron),
+            ("3-iron", self.three_iron),
+            ("5-wood", self.five_wood),
+            ("3-wood", self.three_wood),
             ("driver", self.driver),
-        ]
-        
-        # Find the club with distance closest to but not significantly under target
-        best_club = "7_iron"  # Default fallback
-        best_diff = float('inf')
-        
-        for club_name, club_distance in clubs:
-            # Prefer clubs that can reach the distance, but allow some under-club tolerance
-            diff = abs(target_distance - club_distance)
-            if club_distance >= target_distance * 0.9:  # Allow 10% under-club tolerance
-                if diff < best_diff:
-                    best_diff = diff
-                    best_club = club_name
-        
-        return best_club.replace("_", "-")
+        ], key=lambda p: p[1])
+        object.__setattr__(self, "_sorted_names", tuple(name for name, _ in pairs))
+        object.__setattr__(self, "_sorted_dists", np.fromiter((d for _, d in pairs), dtype=np.int32))
+
+    def get_club_for_distance(self, target_distance: int) -> str:
+        """Find the most appropriate club for a given distance.
 
+        Picks the shortest club that reaches the target; if nothing
+        reaches it, the longest club in the bag.
+        """
+        idx = int(np.searchsorted(self._sorted_dists, target_distance, side="left"))
+        if idx == len(self._sorted_names):
+            idx -= 1  # beyond the longest club
+        return self._sorted_names[idx]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ProximityData:
     """Proximity to target data by distance."""
     yards_50: int
@@ -88,6 +105,8 @@ class ProximityData:
     yards_150: int
     yards_175: int
     yards_200: int
+    _thresholds: tuple = field(init=False, repr=False, compare=False)
+    _values: tuple = field(init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, int]) -> 'ProximityData':
@@ -102,25 +121,20 @@ class ProximityData:
             yards_200=data["200_yards"],
         )
 
+    def __post_init__(self):
+        # Threshold ladder flattened to a tuple so lookup is one C-level
+        # binary search instead of up to six Python comparisons.
+        object.__setattr__(self, "_thresholds", (50, 75, 100, 125, 150, 175))
+        object.__setattr__(self, "_values", (self.yards_50, self.yards_75, self.yards_100,
+                                             self.yards_125, self.yards_150, self.yards_175,
+                                             self.yards_200))
+
     def get_expected_proximity(self, distance: int) -> int:
         """Get expected proximity for a given approach distance."""
-        if distance <= 50:
-            return self.yards_50
-        elif distance <= 75:
-            return self.yards_75
-        elif distance <= 100:
-            return self.yards_100
-        elif distance <= 125:
-            return self.yards_125
-        elif distance <= 150:
-            return self.yards_150
-        elif distance <= 175:
-            return self.yards_175
-        else:
-            return self.yards_200
+        return self._values[bisect_left(self._thresholds, distance)]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GreensInRegulation:
     """Greens in regulation percentages by distance."""
     overall: int
@@ -129,6 +143,8 @@ class GreensInRegulation:
     yards_150_175: int
     yards_175_200: int
     yards_200_plus: int
+    _thresholds: tuple = field(init=False, repr=False, compare=False)
+    _values: tuple = field(init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, int]) -> 'GreensInRegulation':
@@ -142,21 +158,19 @@ class GreensInRegulation:
             yards_200_plus=data["200_plus_yards"],
         )
 
+    def __post_init__(self):
+        object.__setattr__(self, "_thresholds", (125, 150, 175, 200))
+        object.__setattr__(self, "_values", (self.yards_100_125, self.yards_125_150,
+                                             self.yards_150_175, self.yards_175_200,
+                                             self.yards_200_plus))
+
     def get_gir_percentage(self, distance: int) -> int:
         """Get expected GIR percentage for a given distance."""
-        if distance <= 125:
-            return self.yards_100_125
-        elif distance <= 150:
-            return self.yards_125_150
-        elif distance <= 175:
-            return self.yards_150_175
-        elif distance <= 200:
-            return self.yards_175_200
-        else:
-            return self.yards_200_plus
+        # Buckets are right-open: a 150y approach counts in the 150-175 band.
+        return self._values[bisect_right(self._thresholds, distance)]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ShortGame:
     """Short game statistics."""
     sand_save_percentage: int
@@ -175,7 +189,7 @@ class ShortGame:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PuttingStats:
     """Putting statistics."""
     putts_per_round: float
@@ -186,6 +200,8 @@ class PuttingStats:
     make_percentage_10_feet: int
     make_percentage_15_feet: int
     make_percentage_20_feet: int
+    _thresholds: tuple = field(init=False, repr=False, compare=False)
+    _values: tuple = field(init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PuttingStats':
@@ -201,21 +217,18 @@ class PuttingStats:
             make_percentage_20_feet=data["make_percentage_20_feet"],
         )
 
+    def __post_init__(self):
+        object.__setattr__(self, "_thresholds", (3, 6, 10, 15))
+        object.__setattr__(self, "_values", (self.make_percentage_3_feet, self.make_percentage_6_feet,
+                                             self.make_percentage_10_feet, self.make_percentage_15_feet,
+                                             self.make_percentage_20_feet))
+
     def get_make_percentage(self, distance_feet: int) -> int:
         """Get expected make percentage for a given putt distance."""
-        if distance_feet <= 3:
-            return self.make_percentage_3_feet
-        elif distance_feet <= 6:
-            return self.make_percentage_6_feet
-        elif distance_feet <= 10:
-            return self.make_percentage_10_feet
-        elif distance_feet <= 15:
-            return self.make_percentage_15_feet
-        else:
-            return self.make_percentage_20_feet
+        return self._values[bisect_left(self._thresholds, distance_feet)]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HandicapStats:
     """Complete statistics for a specific handicap level."""
     handicap: int
@@ -246,9 +259,56 @@ class HandicapStats:
         )
 
 
+# Structure-of-arrays layout for the hot lookups: clubs are ordered by
+# ascending distance so a per-row binary search picks the recommendation.
+_CLUB_KEYS_ASC = (
+    "lob_wedge", "sand_wedge", "pitching_wedge", "9_iron", "8_iron", "7_iron",
+    "6_iron", "5_iron", "4_iron", "3_iron", "5_wood", "3_wood", "driver",
+)
+_CLUB_ATTRS_ASC = (
+    "lob_wedge", "sand_wedge", "pitching_wedge", "nine_iron", "eight_iron",
+    "seven_iron", "six_iron", "five_iron", "four_iron", "three_iron",
+    "five_wood", "three_wood", "driver",
+)
+_CLUB_NAMES_HYPHEN = tuple(k.replace("_", "-") for k in _CLUB_KEYS_ASC)
+# Accept both the JSON-style keys ("7_iron") and attribute names ("seven_iron").
+_CLUB_COL = {k: i for i, k in enumerate(_CLUB_KEYS_ASC)}
+_CLUB_COL.update({a: i for i, a in enumerate(_CLUB_ATTRS_ASC)})
+# Pre-register hyphenated, spaced and title-cased variants so the common
+# spellings ("7-iron", "Sand Wedge") hit the table directly, with no
+# per-call lower/replace string allocations.
+for _name, _col in list(_CLUB_COL.items()):
+    for _variant in (_name, _name.replace("_", "-"), _name.replace("_", " ")):
+        _CLUB_COL.setdefault(_variant, _col)
+        _CLUB_COL.setdefault(_variant.title(), _col)
+
+# Sentinel distinguishing "not built yet" from "malformed entry" (None).
+_UNSET = object()
+
+_PROX_THRESHOLDS = (50, 75, 100, 125, 150, 175)
+_PROX_KEYS = ("50_yards", "75_yards", "100_yards", "125_yards",
+              "150_yards", "175_yards", "200_yards")
+_GIR_THRESHOLDS = (125, 150, 175, 200)
+_GIR_KEYS = ("100_125_yards", "125_150_yards", "150_175_yards",
+             "175_200_yards", "200_plus_yards")
+
+
+# Column layout of the bulk statistics matrix (see get_stats_bulk).
+STATS_BULK_COLUMNS = (
+    "driver",
+    "seven_iron",
+    "pitching_wedge",
+    "gir_overall",
+    "fairways_hit",
+    "scrambling_percentage",
+    "three_putts_per_round",
+    "average_score",
+)
+
+
 class GolfStatistics:
     """Golf statistics database for handicap-specific performance data."""
-    
+
     def __init__(self, stats_file: Optional[str] = None):
         """Initialize with statistics data file."""
         if stats_file is None:
@@ -257,7 +317,13 @@ class GolfStatistics:
             stats_file = current_dir / "golf_statistics_by_handicap.json"
         
         self.stats_file = Path(stats_file)
-        self._stats_cache: Dict[int, HandicapStats] = {}
+        # Fixed 21-slot table indexed by clamped handicap: a single list
+        # index instead of a dict hash per get_stats call.
+        self._stats: list = [_UNSET] * 21
+        self._stats_matrix: Optional[np.ndarray] = None
+        # Memoized prompt strings keyed by (clamped handicap, distance);
+        # 21 handicaps x a few hundred distances saturates quickly.
+        self._ctx_cache: Dict[tuple[int, int], str] = {}
         self._load_statistics()
     
     def _load_statistics(self) -> None:
@@ -268,52 +334,129 @@ class GolfStatistics:
         with open(self.stats_file, 'r') as f:
             data = json.load(f)
         
-        handicap_data = data["handicap_statistics"]
-        for handicap_str, stats_dict in handicap_data.items():
+        # Keep the raw dicts and build HandicapStats lazily in get_stats:
+        # most sessions only ever touch one or two handicaps, and a
+        # malformed entry surfaces as a missing handicap instead of
+        # failing the whole load.
+        self._raw: Dict[str, Any] = data["handicap_statistics"]
+
+        # Structure-of-arrays mirror of the hot fields: one integer index
+        # replaces a three-object attribute walk in the per-prompt lookups.
+        self._club_dists = np.zeros((21, 13), np.int16)
+        self._proximity = np.zeros((21, 7), np.int16)
+        self._gir = np.zeros((21, 5), np.int16)
+        self._categories: list[Optional[str]] = [None] * 21
+        for handicap_str, stats_dict in self._raw.items():
             handicap = int(handicap_str)
-            self._stats_cache[handicap] = HandicapStats.from_dict(handicap, stats_dict)
+            if not 0 <= handicap <= 20:
+                continue
+            try:
+                category = stats_dict["category"]
+                clubs = [stats_dict["club_distances"][k] for k in _CLUB_KEYS_ASC]
+                prox = [stats_dict["proximity_to_target"][k] for k in _PROX_KEYS]
+                gir = [stats_dict["greens_in_regulation"][k] for k in _GIR_KEYS]
+            except (KeyError, TypeError):
+                continue
+            self._categories[handicap] = category
+            self._club_dists[handicap] = clubs
+            self._proximity[handicap] = prox
+            self._gir[handicap] = gir
     
     def get_stats(self, handicap: int) -> Optional[HandicapStats]:
         """Get statistics for a specific handicap (0-20)."""
         # Clamp handicap to valid range
         handicap = max(0, min(20, handicap))
-        return self._stats_cache.get(handicap)
+        stats = self._stats[handicap]
+        if stats is _UNSET:
+            raw = self._raw.get(str(handicap))
+            try:
+                stats = HandicapStats.from_dict(handicap, raw) if raw is not None else None
+            except (KeyError, TypeError):
+                stats = None
+            self._stats[handicap] = stats
+        return stats
     
+    def get_stats_bulk(self, handicaps: np.ndarray) -> np.ndarray:
+        """Vectorized stats lookup for many handicaps at once.
+
+        Returns a float32 array of shape (len(handicaps), len(STATS_BULK_COLUMNS))
+        gathered from a structure-of-arrays matrix indexed by handicap, so
+        batch enrichment (analytics, replays) does one NumPy gather instead
+        of N Python attribute chains. Handicaps are clamped like get_stats;
+        a handicap whose entry failed to parse comes back as a NaN row,
+        mirroring the None that get_stats returns for it.
+        """
+        if self._stats_matrix is None:
+            # Always 21 rows, one per handicap: skipping malformed entries
+            # would shift every row above them onto the wrong handicap.
+            matrix = np.full((21, len(STATS_BULK_COLUMNS)), np.nan, dtype=np.float32)
+            for h in range(21):
+                s = self.get_stats(h)
+                if s is None:
+                    continue
+                matrix[h] = (
+                    s.club_distances.driver,
+                    s.club_distances.seven_iron,
+                    s.club_distances.pitching_wedge,
+                    s.greens_in_regulation.overall,
+                    s.fairways_hit,
+                    s.short_game.scrambling_percentage,
+                    s.putting.three_putts_per_round,
+                    s.average_score,
+                )
+            self._stats_matrix = matrix
+        idx = np.clip(np.asarray(handicaps, dtype=np.intp), 0, 20)
+        return self._stats_matrix[idx]
+
     def get_expected_distance(self, handicap: int, club: str) -> Optional[int]:
         """Get expected distance for a club and handicap."""
-        stats = self.get_stats(handicap)
-        if not stats:
+        h = max(0, min(20, handicap))
+        if self._categories[h] is None:
             return None
-        
-        club_attr = club.lower().replace("-", "_").replace(" ", "_")
-        return getattr(stats.club_distances, club_attr, None)
+        col = _CLUB_COL.get(club)
+        if col is None:
+            # Unseen spelling: normalize once (memoized) and retry.
+            col = _CLUB_COL.get(_club_attr_name(club))
+        if col is None:
+            return None
+        return int(self._club_dists[h, col])
     
     def get_club_recommendation(self, handicap: int, target_distance: int) -> Optional[str]:
         """Get club recommendation for target distance and handicap."""
-        stats = self.get_stats(handicap)
-        if not stats:
+        h = max(0, min(20, handicap))
+        if self._categories[h] is None:
             return None
-        
-        return stats.club_distances.get_club_for_distance(target_distance)
+        return _CLUB_NAMES_HYPHEN[self._club_index_for_distance(h, target_distance)]
+
+    def _club_index_for_distance(self, h: int, target_distance: int) -> int:
+        """Shortest club that reaches the target, else the longest in the bag."""
+        idx = int(np.searchsorted(self._club_dists[h], target_distance, side="left"))
+        return idx if idx < len(_CLUB_NAMES_HYPHEN) else len(_CLUB_NAMES_HYPHEN) - 1
     
     def get_performance_context(self, handicap: int, distance: int) -> str:
         """Get performance context string for LLM prompts."""
-        stats = self.get_stats(handicap)
-        if not stats:
+        h = max(0, min(20, handicap))
+        cached = self._ctx_cache.get((h, distance))
+        if cached is not None:
+            return cached
+        category = self._categories[h]
+        if category is None:
             return f"Handicap {handicap} player"
-        
-        club_rec = stats.club_distances.get_club_for_distance(distance)
-        proximity = stats.proximity_to_target.get_expected_proximity(distance)
-        gir_pct = stats.greens_in_regulation.get_gir_percentage(distance)
-        
+
+        club_rec = _CLUB_NAMES_HYPHEN[self._club_index_for_distance(h, distance)]
+        proximity = int(self._proximity[h][bisect_left(_PROX_THRESHOLDS, distance)])
+        gir_pct = int(self._gir[h][bisect_right(_GIR_THRESHOLDS, distance)])
+
         context_parts = [
-            f"Handicap {handicap} ({stats.category})",
+            f"Handicap {handicap} ({category})",
             f"Typical {club_rec} for {distance}y",
             f"Expected proximity: {proximity}ft",
             f"GIR rate: {gir_pct}%",
         ]
-        
-        return " | ".join(context_parts)
+
+        context = " | ".join(context_parts)
+        self._ctx_cache[(h, distance)] = context
+        return context
     
     def validate_distance_claim(self, handicap: int, club: str, claimed_distance: int) -> tuple[bool, str]:
         """Validate if a claimed distance is realistic for handicap/club combination."""
@@ -332,14 +475,35 @@ class GolfStatistics:
         else:
             return False, f"Unusually long (expected ~{expected}y)"
 
+    def validate_distance_claims(self, handicaps, clubs, distances) -> tuple[np.ndarray, list[str]]:
+        """Validate many distance claims at once.
 
-# Global instance for easy access
-_golf_stats: Optional[GolfStatistics] = None
+        Vectorised counterpart to validate_distance_claim: one fancy-index
+        into the club-distance matrix plus array comparisons, instead of a
+        Python call per shot. Returns a boolean array and per-claim reasons.
+        Unknown clubs validate as True, matching the scalar method.
+        """
+        handicaps = np.clip(np.asarray(handicaps, dtype=np.intp), 0, 20)
+        distances = np.asarray(distances)
+        cols = np.fromiter(
+            (_CLUB_COL.get(_club_attr_name(c), -1) for c in clubs),
+            dtype=np.intp, count=len(clubs),
+        )
+        known = cols >= 0
+        expected = self._club_dists[handicaps, np.where(known, cols, 0)]
+        ok = (~known) | ((distances >= expected * 0.8) & (distances <= expected * 1.2))
+        reasons = [
+            "Unknown club" if not k
+            else "Realistic" if o
+            else f"Unusually {'short' if d < e * 0.8 else 'long'} (expected ~{e}y)"
+            for k, o, d, e in zip(known, ok, distances, expected)
+        ]
+        return ok, reasons
 
 
+# Global instance for easy access; functools.cache makes the singleton a
+# single C-level cache hit per call and gives tests cache_clear() to reset.
+@functools.cache
 def get_golf_statistics() -> GolfStatistics:
     """Get the global golf statistics instance."""
-    global _golf_stats
-    if _golf_stats is None:
-        _golf_stats = GolfStatistics()
-    return _golf_stats
\ No newline at end of file
+    return GolfStatistics()
\ No newline at end of file
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import atexit
 import os
 import json
 from typing import Optional
@@ -17,6 +18,98 @@ try:
 except Exception as _e:  # pragma: no cover
     sd = None
 
+# Read once at import: speak() consulted this env var on every debug
+# print site, paying a getenv lookup per call.
+_DEBUG = bool(os.getenv("GC_DEBUG"))
+
+_client: Optional[httpx.Client] = None
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared TTS HTTP client, creating it on first use.
+
+    Reusing one client keeps the TLS connection to the TTS endpoint
+    alive between speak() calls, which dominates latency for short
+    utterances.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+        atexit.register(_client.close)
+    return _client
+
+
+_out_stream: Optional["sd.OutputStream"] = None
+_out_stream_rate: Optional[int] = None
+
+
+def _find_output_device() -> Optional[int]:
+    """Prefer the Pipewire device when present, else the default output."""
+    try:
+        for i, device in enumerate(sd.query_devices()):
+            if 'pipewire' in device['name'].lower():
+                return i
+    except Exception:
+        pass
+    return None
+
+
+def _get_output_stream(sample_rate: int) -> "sd.OutputStream":
+    """Return a persistent output stream, (re)opened on sample-rate change.
+
+    Keeping the device open across speak() calls avoids the ~50-200ms
+    reopen cost per utterance, and writing float32 directly skips the
+    int16 conversion copy that sd.play would otherwise make.
+    """
+    global _out_stream, _out_stream_rate
+    if _out_stream is None or _out_stream_rate != sample_rate:
+        _close_output_stream()
+        _out_stream = sd.OutputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype="float32",
+            device=_find_output_device(),
+        )
+        _out_stream.start()
+        _out_stream_rate = sample_rate
+    return _out_stream
+
+
+def _close_output_stream() -> None:
+    global _out_stream
+    if _out_stream is not None:
+        try:
+            _out_stream.close()
+        except Exception:
+            pass
+        _out_stream = None
+
+
+atexit.register(_close_output_stream)
+
+
+def _to_int16(float_samples: np.ndarray) -> np.ndarray:
+    """Convert float32 samples to int16 with one transient buffer.
+
+    Clips into a fresh float array, scales it in place, then converts -
+    one fewer intermediate than chaining clip/multiply/astype.
+    """
+    scaled = np.clip(float_samples, -1.0, 1.0)
+    scaled *= 32767.0
+    return scaled.astype(np.int16)
+
+
+def _write_wav(path: str, int16_samples: np.ndarray, sample_rate: int) -> None:
+    """Write mono 16-bit PCM to a WAV file."""
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)  # 16-bit
+        wf.setframerate(sample_rate)
+        wf.writeframes(int16_samples.tobytes())
+
 
 def speak(
     text: str,
@@ -42,175 +135,146 @@ def speak(
 
     tts_url = os.getenv("SPEECHMATICS_TTS_URL", "https://preview.tts.speechmatics.com/generate")
     # Debug: show config
-    if os.getenv("GC_DEBUG"):
+    if _DEBUG:
         print(f"[TTS] using url={tts_url} text_len={len(text)} api_key_set={bool(api_key)}")
-    # DNS debug
-    try:
-        host = urlparse(tts_url).hostname
-        if host:
-            try:
-                addrs = socket.getaddrinfo(host, None)
-                if os.getenv("GC_DEBUG"):
+    # DNS debug - only pay the getaddrinfo syscall when debugging
+    if _DEBUG:
+        try:
+            host = urlparse(tts_url).hostname
+            if host:
+                try:
+                    addrs = socket.getaddrinfo(host, None)
                     print(f"[TTS] DNS {host} -> {set(a[4][0] for a in addrs)}")
-            except Exception as dns_err:
-                fallback = "https://preview.tts.speechmatics.com/generate"
-                if os.getenv("GC_DEBUG"):
+                except Exception as dns_err:
+                    fallback = "https://preview.tts.speechmatics.com/generate"
                     print(f"[TTS] DNS failed for {host}: {dns_err}. Falling back to {fallback}")
-                tts_url = fallback
-    except Exception as e:
-        print(f"[TTS] DNS lookup failed: {e}")
+                    tts_url = fallback
+        except Exception as e:
+            print(f"[TTS] DNS lookup failed: {e}")
 
     payload = {"text": text}
     # language/voice selection may be added by the service later; keep payload minimal per quickstart
 
     try:
-        with httpx.Client(timeout=30.0) as client:
-            resp = client.post(tts_url, headers={"Authorization": f"Bearer {api_key}"}, json=payload)
-            resp.raise_for_status()
-
-            # API returns WAV format, not raw PCM as documented
-            raw_audio = resp.content
-            content_type = resp.headers.get('content-type', '')
-            if os.getenv("GC_DEBUG"):
-                print(f"[TTS] HTTP {resp.status_code} content-type={content_type} bytes={len(raw_audio)}")
-            if sd is None:  # pragma: no cover
-                print("Speechmatics TTS: sounddevice not available; printing text:")
-                print(text)
-                return
-
-            # Parse WAV file directly from response
-            if content_type == 'audio/wav':
-                # Write to temporary file and read with wave library
-                fd, wav_temp_path = tempfile.mkstemp(suffix=".wav")
-                try:
-                    os.write(fd, raw_audio)
-                    os.close(fd)
+        client = _get_client()
+        resp = client.post(tts_url, headers={"Authorization": f"Bearer {api_key}"}, json=payload)
+        resp.raise_for_status()
+
+        # API returns WAV format, not raw PCM as documented
+        raw_audio = resp.content
+        content_type = resp.headers.get('content-type', '')
+        if _DEBUG:
+            print(f"[TTS] HTTP {resp.status_code} content-type={content_type} bytes={len(raw_audio)}")
+        if sd is None:  # pragma: no cover
+            print("Speechmatics TTS: sounddevice not available; printing text:")
+            print(text)
+            return
+
+        # Parse WAV file directly from response
+        if content_type == 'audio/wav':
+            # Write to temporary file and read with wave library
+            fd, wav_temp_path = tempfile.mkstemp(suffix=".wav")
+            try:
+                os.write(fd, raw_audio)
+                os.close(fd)
                     
-                    with wave.open(wav_temp_path, 'rb') as wf:
-                        frames = wf.readframes(wf.getnframes())
-                        sample_rate = wf.getframerate()
-                        sample_width = wf.getsampwidth()
+                with wave.open(wav_temp_path, 'rb') as wf:
+                    frames = wf.readframes(wf.getnframes())
+                    sample_rate = wf.getframerate()
+                    sample_width = wf.getsampwidth()
                         
-                        if sample_width == 2:  # 16-bit
-                            int16_samples = np.frombuffer(frames, dtype='<i2')
-                            float_samples = int16_samples.astype(np.float32) / 32767.0
-                        else:  # fallback
-                            float_samples = np.frombuffer(frames, dtype='<f4')
-                finally:
-                    try:
-                        os.unlink(wav_temp_path)
-                    except:
-                        pass
-            else:
-                # Fallback: try parsing as raw PCM
-                float_samples = np.frombuffer(raw_audio, dtype='<f4')
-                float_samples = np.nan_to_num(float_samples, nan=0.0, posinf=0.0, neginf=0.0)
-            
-            # Debug: short confirmation of playback parameters
-            print(f"[TTS] url={tts_url} bytes={len(raw_audio)} samples={len(float_samples)} sr={sample_rate}")
-
-            # Save WAV file for debugging and optional replay
-            wav_path = None
-            want_replay = bool(os.getenv("GC_TTS_REPLAY"))
-            # Always save WAV file for debugging audio issues
-            if True:
+                    if sample_width == 2:  # 16-bit
+                        int16_samples = np.frombuffer(frames, dtype='<i2')
+                        float_samples = int16_samples.astype(np.float32) / 32767.0
+                    else:  # fallback
+                        float_samples = np.frombuffer(frames, dtype='<f4')
+            finally:
                 try:
-                    int16_samples = (np.clip(float_samples, -1.0, 1.0) * 32767).astype(np.int16)
+                    os.unlink(wav_temp_path)
+                except:
+                    pass
+        else:
+            # Fallback: try parsing as raw PCM
+            float_samples = np.frombuffer(raw_audio, dtype='<f4')
+            float_samples = np.nan_to_num(float_samples, nan=0.0, posinf=0.0, neginf=0.0)
+            
+        # Debug: short confirmation of playback parameters
+        print(f"[TTS] url={tts_url} bytes={len(raw_audio)} samples={len(float_samples)} sr={sample_rate}")
+
+        # Save WAV file only when a replay may be requested; the int16
+        # conversion happens at most once and is reused on the error path.
+        wav_path = None
+        int16_samples = None
+        want_replay = bool(os.getenv("GC_TTS_REPLAY"))
+        if want_replay:
+            try:
+                int16_samples = _to_int16(float_samples)
+                fd, tmp_path = tempfile.mkstemp(prefix="golfcaddie_tts_", suffix=".wav")
+                os.close(fd)
+                _write_wav(tmp_path, int16_samples, sample_rate)
+                wav_path = tmp_path
+                if _DEBUG:
+                    print(f"[TTS] Saved WAV for replay: {wav_path}")
+            except Exception as wav_err:
+                print(f"[TTS] Could not save WAV for replay: {wav_err}")
+
+        # Write to the persistent stream; blocks only until the
+        # buffer drains, and no int16 copy is made on the hot path.
+        try:
+            _get_output_stream(sample_rate).write(float_samples)
+        except Exception as play_err:
+            print(f"[TTS] Playback error: {play_err}. Saving WAV for manual playback.")
+            # On playback error, save a WAV to help the user manually play it
+            try:
+                if int16_samples is None:
+                    int16_samples = _to_int16(float_samples)
+                if not wav_path:
                     fd, tmp_path = tempfile.mkstemp(prefix="golfcaddie_tts_", suffix=".wav")
                     os.close(fd)
-                    with wave.open(tmp_path, "wb") as wf:
-                        wf.setnchannels(1)
-                        wf.setsampwidth(2)  # 16-bit
-                        wf.setframerate(sample_rate)
-                        wf.writeframes(int16_samples.tobytes())
                     wav_path = tmp_path
-                    if os.getenv("GC_DEBUG"):
-                        print(f"[TTS] Saved WAV for replay: {wav_path}")
-                except Exception as wav_err:
-                    print(f"[TTS] Could not save WAV for replay: {wav_err}")
+                _write_wav(wav_path, int16_samples, sample_rate)
+                print(f"[TTS] Saved WAV: {wav_path}")
+            except Exception as wav_err:
+                print(f"[TTS] Could not save WAV: {wav_err}")
 
-            # Attempt playback with explicit device selection
+        # Offer replay and optional delete
+        if want_replay and wav_path:
             try:
-                # Try Pipewire first (device 16), fallback to default
-                output_device = None
-                try:
-                    devices = sd.query_devices()
-                    for i, device in enumerate(devices):
-                        if 'pipewire' in device['name'].lower():
-                            output_device = i
-                            break
-                except Exception:
-                    pass
-                
-                sd.play(float_samples, samplerate=sample_rate, device=output_device)
-                sd.wait()
-            except Exception as play_err:
-                print(f"[TTS] Playback error: {play_err}. Saving WAV for manual playback.")
-                # On playback error, save a WAV to help the user manually play it
-                try:
-                    int16_samples = (np.clip(float_samples, -1.0, 1.0) * 32767).astype(np.int16)
-                    if not wav_path:
-                        fd, tmp_path = tempfile.mkstemp(prefix="golfcaddie_tts_", suffix=".wav")
-                        os.close(fd)
-                        wav_path = tmp_path
-                    with wave.open(wav_path, "wb") as wf:
-                        wf.setnchannels(1)
-                        wf.setsampwidth(2)  # 16-bit
-                        wf.setframerate(sample_rate)
-                        wf.writeframes(int16_samples.tobytes())
-                    print(f"[TTS] Saved WAV: {wav_path}")
-                except Exception as wav_err:
-                    print(f"[TTS] Could not save WAV: {wav_err}")
-
-            # Offer replay and optional delete
-            if want_replay and wav_path:
-                try:
-                    if sys.stdin and sys.stdin.isatty():
-                        while True:
-                            ans = input("Replay audio? [y/N]: ").strip().lower()
-                            if ans in ("y", "yes"):
-                                try:
-                                    # Use same device selection logic for replay
-                                    output_device = None
-                                    try:
-                                        devices = sd.query_devices()
-                                        for i, device in enumerate(devices):
-                                            if 'pipewire' in device['name'].lower():
-                                                output_device = i
-                                                break
-                                    except Exception:
-                                        pass
-                                    sd.play(float_samples, samplerate=sample_rate, device=output_device)
-                                    sd.wait()
-                                except Exception as play_err2:
-                                    print(f"[TTS] Replay error: {play_err2}")
-                                    break
-                            else:
+                if sys.stdin and sys.stdin.isatty():
+                    while True:
+                        ans = input("Replay audio? [y/N]: ").strip().lower()
+                        if ans in ("y", "yes"):
+                            try:
+                                _get_output_stream(sample_rate).write(float_samples)
+                            except Exception as play_err2:
+                                print(f"[TTS] Replay error: {play_err2}")
                                 break
-                    else:
-                        # Non-interactive: no replay possible
-                        if os.getenv("GC_DEBUG"):
-                            print("[TTS] Non-interactive session; skipping replay prompt.")
-                except Exception as prompt_err:
-                    print(f"[TTS] Prompt error: {prompt_err}")
-                finally:
-                    try:
-                        if os.path.exists(wav_path):
-                            os.remove(wav_path)
-                            if os.getenv("GC_DEBUG"):
-                                print("[TTS] Deleted WAV file.")
-                    except Exception as del_err:
-                        print(f"[TTS] Could not delete WAV: {del_err}")
-            else:
-                # Best-effort cleanup of legacy file path from older versions
+                        else:
+                            break
+                else:
+                    # Non-interactive: no replay possible
+                    if _DEBUG:
+                        print("[TTS] Non-interactive session; skipping replay prompt.")
+            except Exception as prompt_err:
+                print(f"[TTS] Prompt error: {prompt_err}")
+            finally:
                 try:
-                    legacy = os.path.abspath("tts_output.wav")
-                    if os.path.exists(legacy) and not bool(os.getenv("GC_TTS_REPLAY")):
-                        os.remove(legacy)
-                        if os.getenv("GC_DEBUG"):
-                            print(f"[TTS] Deleted legacy WAV file: {legacy}")
-                except Exception:
-                    pass
+                    if os.path.exists(wav_path):
+                        os.remove(wav_path)
+                        if _DEBUG:
+                            print("[TTS] Deleted WAV file.")
+                except Exception as del_err:
+                    print(f"[TTS] Could not delete WAV: {del_err}")
+        else:
+            # Best-effort cleanup of legacy file path from older versions
+            try:
+                legacy = os.path.abspath("tts_output.wav")
+                if os.path.exists(legacy) and not want_replay:
+                    os.remove(legacy)
+                    if _DEBUG:
+                        print(f"[TTS] Deleted legacy WAV file: {legacy}")
+            except Exception:
+                pass
     except Exception as e:  # pragma: no cover
         print(f"Speechmatics TTS error: {type(e).__name__}: {e}; printing text:")
         print(text)
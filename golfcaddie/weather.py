@@ -1,18 +1,114 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
 import math
+import os
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
+from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
 import httpx
+import numpy as np
 
+try:
+    # orjson parses the small open-meteo payload in roughly half the
+    # time and is picked up automatically when installed.
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:
+    from json import loads as _json_loads
+
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared weather HTTP client, creating it on first use.
+
+    One pooled client keeps the connection to open-meteo alive between
+    fetches instead of paying a TCP+TLS handshake per wind lookup.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    timeout=2.0,
+                    headers={"accept": "application/json"},
+                )
+                atexit.register(_client.close)
+    return _client
+
+
+_MS_TO_MPH = 2.23694
+
+# Degree lookup tables: bearings arrive as integer degrees, so the scalar
+# component math can index these instead of calling libm.
+_SIN_DEG = np.sin(np.deg2rad(np.arange(360)))
+_COS_DEG = np.cos(np.deg2rad(np.arange(360)))
+
+# Bound once: skips the math-module attribute lookup on every call.
+_sin = math.sin
+_cos = math.cos
+_radians = math.radians
 
-_CACHE: dict[str, tuple[float, float, float]] = {}
 _CACHE_TTL_SEC = 60.0
+_CACHE_MAXSIZE = 256
+
+# Adaptive TTL bounds: steady conditions stretch toward _TTL_MAX_SEC,
+# gusty ones shrink toward _TTL_MIN_SEC.
+_TTL_MIN_SEC = 20.0
+_TTL_MAX_SEC = 600.0
+_VOL_ALPHA = 0.3
+# Seed volatility so the first reading gets exactly the old 60s TTL.
+_VOL_SEED = math.log(_TTL_MAX_SEC / _CACHE_TTL_SEC) ** 2
+
+
+def _adaptive_ttl(ema_var: float) -> float:
+    return min(_TTL_MAX_SEC, max(_TTL_MIN_SEC, _TTL_MAX_SEC * math.exp(-math.sqrt(ema_var))))
+
+
+class _WindCache:
+    """Bounded LRU cache with per-entry TTL for wind readings.
+
+    A mobile user moving between coordinates would grow a plain dict
+    without bound; this keeps the footprint at maxsize entries and
+    refreshes recency on every hit.
+    """
+
+    def __init__(self, maxsize: int = _CACHE_MAXSIZE):
+        self._data: OrderedDict[tuple[int, int], tuple] = OrderedDict()
+        self.maxsize = maxsize
+
+    def get(self, key: tuple[int, int]) -> Optional[tuple]:
+        """Return a fresh entry or None, marking the key recently used."""
+        entry = self._data.get(key)
+        if entry is None or time.monotonic() - entry[0] > entry[5]:
+            return None
+        self._data.move_to_end(key)
+        return entry
+
+    def peek(self, key: tuple[int, int]) -> Optional[tuple]:
+        """Return the entry regardless of age, without touching recency."""
+        return self._data.get(key)
+
+    def set(self, key: tuple[int, int], entry: tuple) -> None:
+        self._data[key] = entry
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
 
+_CACHE = _WindCache()
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Wind:
     speed_ms: float
     direction_deg: int  # meteorological: from which it blows
@@ -21,87 +117,357 @@ class Wind:
     summary: str
 
 
-def _cache_key(lat: float, lon: float) -> str:
-    return f"{lat:.4f},{lon:.4f}"
+def _cache_key(lat: float, lon: float) -> tuple[int, int]:
+    # Integer tuple instead of a formatted string: hashing two small ints
+    # is cheaper than formatting and hashing a 20-char key, at the same
+    # 4-decimal (~11m) resolution.
+    return round(lat * 10000), round(lon * 10000)
 
 
 def _from_cache(lat: float, lon: float) -> Optional[tuple[float, float]]:
-    k = _cache_key(lat, lon)
-    if k in _CACHE:
-        ts, speed_ms, dir_deg = _CACHE[k]
-        if time.time() - ts <= _CACHE_TTL_SEC:
-            return speed_ms, dir_deg
+    entry = _CACHE.get(_cache_key(lat, lon))
+    if entry is not None:
+        return entry[1], entry[2]
     return None
 
 
 def _store_cache(lat: float, lon: float, speed_ms: float, dir_deg: int) -> None:
-    _CACHE[_cache_key(lat, lon)] = (time.time(), speed_ms, dir_deg)
+    key = _cache_key(lat, lon)
+    # Volatility EMA over consecutive readings drives the per-entry TTL:
+    # direction deltas are scaled so ~30 degrees weighs like 1 m/s.
+    prev = _CACHE.peek(key)
+    if prev is not None:
+        dspeed = speed_ms - prev[1]
+        ddir = ((dir_deg - prev[2] + 180) % 360 - 180) / 30.0
+        sample = dspeed * dspeed + ddir * ddir
+        ema_var = (1.0 - _VOL_ALPHA) * prev[6] + _VOL_ALPHA * sample
+    else:
+        ema_var = _VOL_SEED
+    # Cache the wind-to vector (east, north) alongside speed/direction:
+    # per-target component math then needs no transcendental calls.
+    rad = _radians((dir_deg + 180) % 360)
+    _CACHE.set(key, (
+        time.monotonic(), speed_ms, dir_deg,
+        speed_ms * _sin(rad), speed_ms * _cos(rad),
+        _adaptive_ttl(ema_var), ema_var,
+    ))
+    if _db is not None:
+        try:
+            with _db_lock:
+                _db.execute(
+                    "INSERT OR REPLACE INTO wind VALUES (?, ?, ?, ?, ?)",
+                    (key[0], key[1], time.time(), speed_ms, dir_deg),
+                )
+                _db.commit()
+        except Exception:
+            pass
 
 
-def fetch_current_wind(lat: float, lon: float, *, timeout_sec: float = 2.0) -> tuple[float, int]:
-    cached = _from_cache(lat, lon)
-    if cached is not None:
-        return cached[0], int(cached[1])
+# Best-effort disk mirror of the wind cache so a fresh CLI process can
+# start from a warm reading instead of a network round-trip. All I/O is
+# wrapped so a missing or corrupt cache file never blocks a fetch.
+_db_lock = threading.Lock()
+
+
+def _open_cache_db() -> Optional[sqlite3.Connection]:
+    try:
+        # GOLFCADDIE_WIND_CACHE_DIR lets tests point the cache at a
+        # temporary directory instead of sharing the user-level one.
+        override = os.environ.get("GOLFCADDIE_WIND_CACHE_DIR")
+        if override:
+            cache_dir = Path(override)
+        else:
+            cache_dir = Path(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))) / "golfcaddie"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(cache_dir / "wind.sqlite"), check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS wind("
+            "key_lat INTEGER, key_lon INTEGER, ts REAL, speed REAL, dir INTEGER, "
+            "PRIMARY KEY(key_lat, key_lon))"
+        )
+        return conn
+    except Exception:
+        return None
+
 
-    url = (
+_db = _open_cache_db()
+
+
+def _hydrate_from_disk() -> None:
+    if _db is None:
+        return
+    try:
+        now_wall = time.time()
+        now_mono = time.monotonic()
+        rows = _db.execute("SELECT key_lat, key_lon, ts, speed, dir FROM wind").fetchall()
+    except Exception:
+        return
+    for key_lat, key_lon, ts, speed, dir_deg in rows:
+        # Disk rows carry wall-clock stamps; rebase onto the monotonic
+        # clock the in-memory TTL logic uses.
+        age = now_wall - ts
+        if 0 <= age <= _CACHE_TTL_SEC:
+            rad = _radians((dir_deg + 180) % 360)
+            _CACHE.set((key_lat, key_lon), (
+                now_mono - age, speed, dir_deg,
+                speed * _sin(rad), speed * _cos(rad),
+                _CACHE_TTL_SEC, _VOL_SEED,
+            ))
+
+
+_hydrate_from_disk()
+
+_refresh_lock = threading.Lock()
+_refreshing: set[tuple[int, int]] = set()
+
+_inflight_lock = threading.Lock()
+_inflight: dict[tuple[int, int], threading.Event] = {}
+
+
+def _wind_url(lat: float, lon: float) -> str:
+    return (
         "https://api.open-meteo.com/v1/forecast"
         f"?latitude={lat}&longitude={lon}&current=wind_speed_10m,wind_direction_10m&timezone=UTC"
     )
+
+
+def _fetch_and_store(lat: float, lon: float, timeout_sec: float,
+                     stale: Optional[tuple] = None) -> tuple[float, int]:
+    url = _wind_url(lat, lon)
     try:
-        with httpx.Client(timeout=timeout_sec) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
-            data = resp.json()
-            current = data.get("current", {})
-            speed_ms = float(current.get("wind_speed_10m", 0.0))
-            direction_deg = int(current.get("wind_direction_10m", 0))
-            _store_cache(lat, lon, speed_ms, direction_deg)
-            return speed_ms, direction_deg
+        resp = _get_client().get(url, timeout=timeout_sec)
+        resp.raise_for_status()
+        data = _json_loads(resp.content)
+        current = data.get("current", {})
+        speed_ms = float(current.get("wind_speed_10m", 0.0))
+        direction_deg = int(current.get("wind_direction_10m", 0))
+        _store_cache(lat, lon, speed_ms, direction_deg)
+        return speed_ms, direction_deg
     except Exception:
         # Fallback to stale cache if available
-        if cached is not None:
-            return cached[0], int(cached[1])
+        if stale is not None:
+            return stale[1], int(stale[2])
         # Unknown wind
         return 0.0, 0
 
 
+def _start_refresh(lat: float, lon: float, timeout_sec: float) -> None:
+    """Kick off at most one background refresh per coordinate."""
+    key = _cache_key(lat, lon)
+    with _refresh_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def _refresh() -> None:
+        try:
+            _fetch_and_store(lat, lon, timeout_sec)
+        finally:
+            with _refresh_lock:
+                _refreshing.discard(key)
+
+    threading.Thread(target=_refresh, daemon=True).start()
+
+
+def fetch_current_wind(lat: float, lon: float, *, timeout_sec: float = 2.0) -> tuple[float, int]:
+    cached = _from_cache(lat, lon)
+    if cached is not None:
+        return cached[0], int(cached[1])
+
+    # Stale-while-revalidate: a reading just past its TTL is still good
+    # enough for a shot recommendation - serve it now and refresh in the
+    # background rather than blocking on a round-trip.
+    stale = _CACHE.peek(_cache_key(lat, lon))
+    if stale is not None and time.monotonic() - stale[0] <= 2 * stale[5]:
+        _start_refresh(lat, lon, timeout_sec)
+        return stale[1], int(stale[2])
+
+    # Single-flight: concurrent misses for the same coordinate share one
+    # request instead of each hitting the API.
+    key = _cache_key(lat, lon)
+    with _inflight_lock:
+        event = _inflight.get(key)
+        owner = event is None
+        if owner:
+            event = threading.Event()
+            _inflight[key] = event
+
+    if not owner:
+        event.wait(timeout_sec)
+        refreshed = _from_cache(lat, lon)
+        if refreshed is not None:
+            return refreshed[0], int(refreshed[1])
+        return _fetch_and_store(lat, lon, timeout_sec, stale)
+
+    try:
+        return _fetch_and_store(lat, lon, timeout_sec, stale)
+    finally:
+        event.set()
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+async def fetch_current_wind_many(
+    coords: list[tuple[float, float]], *, timeout_sec: float = 2.0
+) -> list[tuple[float, int]]:
+    """Fetch wind for many coordinates concurrently.
+
+    Cached coordinates are served from the shared cache; the rest are
+    requested through one AsyncClient so the round-trips overlap instead
+    of serializing. Failed fetches report unknown wind (0.0, 0) like the
+    scalar path.
+    """
+    results: list[tuple[float, int]] = [(0.0, 0)] * len(coords)
+    missing: list[int] = []
+    for i, (lat, lon) in enumerate(coords):
+        cached = _from_cache(lat, lon)
+        if cached is not None:
+            results[i] = (cached[0], int(cached[1]))
+        else:
+            missing.append(i)
+
+    if missing:
+        async with httpx.AsyncClient(
+            timeout=timeout_sec, headers={"accept": "application/json"}
+        ) as aclient:
+            async def _fetch_one(i: int) -> None:
+                lat, lon = coords[i]
+                try:
+                    resp = await aclient.get(_wind_url(lat, lon))
+                    resp.raise_for_status()
+                    current = _json_loads(resp.content).get("current", {})
+                    speed_ms = float(current.get("wind_speed_10m", 0.0))
+                    direction_deg = int(current.get("wind_direction_10m", 0))
+                    _store_cache(lat, lon, speed_ms, direction_deg)
+                    results[i] = (speed_ms, direction_deg)
+                except Exception:
+                    pass
+
+            await asyncio.gather(*(_fetch_one(i) for i in missing))
+
+    return results
+
+
 def compute_components(speed_ms: float, direction_deg_from: int, target_bearing_deg_to: int) -> tuple[float, float]:
     """Return headwind_ms (positive=headwind) and crosswind_ms (positive pushes ball right-to-left).
 
     direction_deg_from: meteorological origin (0 = from north, 90 = from east)
     target_bearing_deg_to: azimuth toward target (0 = north, 90 = east)
     """
+    # Calm day: below summarize_wind's display threshold, skip the trig.
+    if speed_ms < 0.05:
+        return 0.0, 0.0
+    # Integer degrees (the common case) index the precomputed tables -
+    # no radians conversion or libm call at all.
+    if isinstance(direction_deg_from, int) and isinstance(target_bearing_deg_to, int):
+        d = (direction_deg_from + 180 - target_bearing_deg_to) % 360
+        return -speed_ms * float(_COS_DEG[d]), -speed_ms * float(_SIN_DEG[d])
     # Wind vector blowing from direction_deg_from means it blows toward direction_deg_from + 180
     wind_to_deg = (direction_deg_from + 180) % 360
     # Angle between wind-to vector and target bearing
-    theta = math.radians((wind_to_deg - target_bearing_deg_to) % 360)
+    theta = _radians((wind_to_deg - target_bearing_deg_to) % 360)
     # Normalize to [-pi, pi]
     if theta > math.pi:
         theta -= 2 * math.pi
     # Positive headwind when wind opposes target (against ball flight)
-    headwind_ms = -speed_ms * math.cos(theta)
+    headwind_ms = -speed_ms * _cos(theta)
     # Positive crosswind when pushing right-to-left relative to target direction
-    crosswind_ms = -speed_ms * math.sin(theta)
+    crosswind_ms = -speed_ms * _sin(theta)
     return headwind_ms, crosswind_ms
 
 
+def _components_from_vec(vx: float, vy: float, target_bearing_deg_to: int) -> tuple[float, float]:
+    """Head/crosswind from a precomputed wind-to vector (east, north).
+
+    Same sign conventions as compute_components; the trig on the wind
+    direction was already paid when the vector was cached.
+    """
+    b = _radians(target_bearing_deg_to)
+    sb = _sin(b)
+    cb = _cos(b)
+    headwind_ms = -(vx * sb + vy * cb)
+    crosswind_ms = -(vx * cb - vy * sb)
+    return headwind_ms, crosswind_ms
+
+
+def compute_components_batch(speed_ms: float, direction_deg_from: int, bearings: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized compute_components over many target bearings.
+
+    One pair of array trig calls replaces a Python-level loop when
+    evaluating a grid of aim lines against the same wind.
+    """
+    theta = np.deg2rad((direction_deg_from + 180 - np.asarray(bearings)) % 360)
+    return -speed_ms * np.cos(theta), -speed_ms * np.sin(theta)
+
+
 def summarize_wind(speed_ms: float, headwind_ms: float, crosswind_ms: float) -> str:
-    mph = speed_ms * 2.23694
-    parts = [f"{mph:.0f} mph"]
-    if abs(headwind_ms) < 0.5:
+    # The summary only depends on whole mph and which side of the 0.5 m/s
+    # thresholds each component falls, so collapse to those and memoize:
+    # repeated aim previews over the same wind reuse one string.
+    head_state = 0 if abs(headwind_ms) < 0.5 else (1 if headwind_ms > 0 else -1)
+    cross_state = 0 if abs(crosswind_ms) < 0.5 else (1 if crosswind_ms > 0 else -1)
+    return _summarize_cached(int(speed_ms * _MS_TO_MPH + 0.5), head_state, cross_state)
+
+
+@functools.lru_cache(maxsize=1024)
+def _summarize_cached(mph: int, head_state: int, cross_state: int) -> str:
+    # %d skips the format-spec machinery an f-string with :.0f would run.
+    parts = ["%d mph" % mph]
+    if head_state == 0:
         parts.append("neutral wind")
-    elif headwind_ms > 0:
+    elif head_state > 0:
         parts.append("headwind")
     else:
         parts.append("tailwind")
-    if abs(crosswind_ms) >= 0.5:
-        parts.append("right-to-left" if crosswind_ms > 0 else "left-to-right")
+    if cross_state:
+        parts.append("right-to-left" if cross_state > 0 else "left-to-right")
     return ", ".join(parts)
 
 
+def get_wind_batch(lats, lons, bearings) -> np.recarray:
+    """Wind components for many holes in one vectorised pass.
+
+    Coordinates are deduplicated at ~1km resolution so a full 18-hole
+    card costs one fetch, not eighteen, and the component math runs as
+    two array trig calls instead of a Python-level loop per hole.
+    Returns a recarray with fields speed, direction, head, cross using
+    the same sign conventions as compute_components.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    bearings = np.asarray(bearings, dtype=np.float64)
+
+    keys = np.stack((np.round(lats, 2), np.round(lons, 2)), axis=1)
+    uniq, inverse = np.unique(keys, axis=0, return_inverse=True)
+    uniq_speeds = np.empty(len(uniq))
+    uniq_dirs = np.empty(len(uniq))
+    for j, (lat, lon) in enumerate(uniq):
+        speed_ms, dir_from = fetch_current_wind(float(lat), float(lon))
+        uniq_speeds[j] = speed_ms
+        uniq_dirs[j] = dir_from
+
+    speeds = uniq_speeds[inverse]
+    dirs = uniq_dirs[inverse]
+    theta = np.deg2rad((dirs + 180.0 - bearings) % 360.0)
+    out = np.recarray(
+        len(bearings),
+        dtype=[("speed", np.float64), ("direction", np.float64),
+               ("head", np.float64), ("cross", np.float64)],
+    )
+    out.speed = speeds
+    out.direction = dirs
+    out.head = -speeds * np.cos(theta)
+    out.cross = -speeds * np.sin(theta)
+    return out
+
+
 def get_wind(lat: float, lon: float, target_bearing_deg_to: int) -> Wind:
     speed_ms, dir_from = fetch_current_wind(lat, lon)
-    head, cross = compute_components(speed_ms, dir_from, target_bearing_deg_to)
+    entry = _CACHE.peek(_cache_key(lat, lon))
+    if entry is not None and entry[1] == speed_ms and entry[2] == dir_from:
+        head, cross = _components_from_vec(entry[3], entry[4], target_bearing_deg_to)
+    else:
+        head, cross = compute_components(speed_ms, dir_from, target_bearing_deg_to)
     return Wind(
         speed_ms=speed_ms,
         direction_deg=dir_from,
@@ -1,8 +1,32 @@
 import os
 import sys
 
+import pytest
+
 # Ensure project root is on the import path for tests
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
+
+@pytest.fixture(autouse=True)
+def _hermetic_wind_cache(tmp_path, monkeypatch):
+    """Keep the wind cache out of the developer's real ~/.cache.
+
+    golfcaddie.weather opens its sqlite mirror at import time, so without
+    this every test run reads and writes the user-level cache and a rerun
+    within the TTL serves hydrated disk rows instead of exercising the
+    patched client. Point the mirror at tmp_path and start each test from
+    an empty in-memory cache.
+    """
+    from golfcaddie import weather
+
+    monkeypatch.setenv("GOLFCADDIE_WIND_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(weather, "_CACHE", weather._WindCache())
+    monkeypatch.setattr(weather, "_db", weather._open_cache_db())
+    yield
+    if weather._db is not None:
+        try:
+            weather._db.close()
+        except Exception:
+            pass
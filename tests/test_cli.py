@@ -2,26 +2,23 @@ import re
 from click.testing import CliRunner
 
 from golfcaddie.cli import cli
+from golfcaddie.weather import Wind
+
+# Built once: the stub does not need a throwaway class per invocation.
+_STUB_WIND = Wind(
+    speed_ms=4.0,
+    direction_deg=270,
+    headwind_ms=2.0,
+    crosswind_ms=-1.0,
+    summary="9 mph, headwind, left-to-right",
+)
 
 
 def test_cli_weather(monkeypatch):
     runner = CliRunner()
 
     # Stub weather to deterministic values
-    monkeypatch.setattr(
-        "golfcaddie.weather.get_wind",
-        lambda lat, lon, b: type(
-            "W",
-            (),
-            {
-                "speed_ms": 4.0,
-                "direction_deg": 270,
-                "headwind_ms": 2.0,
-                "crosswind_ms": -1.0,
-                "summary": "9 mph, headwind, left-to-right",
-            },
-        )(),
-    )
+    monkeypatch.setattr("golfcaddie.weather.get_wind", lambda lat, lon, b: _STUB_WIND)
 
     res = runner.invoke(cli, ["weather", "40", "105", "0"])
     assert res.exit_code == 0, res.output
@@ -326,12 +326,48 @@ class TestGolfStatistics:
                 assert stats.get_stats(25) == stats.get_stats(20)
 
 
+class TestBulkStats:
+    def test_get_stats_bulk_matches_scalar(self):
+        import numpy as np
+        from golfcaddie.statistics import STATS_BULK_COLUMNS
+
+        stats = GolfStatistics()
+        out = stats.get_stats_bulk(np.array([0, 10, 25, -3]))
+
+        assert out.shape == (4, len(STATS_BULK_COLUMNS))
+        assert out[0][0] == stats.get_stats(0).club_distances.driver
+        assert out[1][3] == stats.get_stats(10).greens_in_regulation.overall
+        # Out-of-range handicaps clamp like get_stats
+        assert out[2][0] == stats.get_stats(20).club_distances.driver
+        assert out[3][0] == stats.get_stats(0).club_distances.driver
+
+
+class TestBatchValidation:
+    def test_validate_distance_claims_matches_scalar(self):
+        import numpy as np
+
+        stats = GolfStatistics()
+        handicaps = [0, 0, 15, 5]
+        clubs = ["driver", "7-iron", "7-iron", "frying-pan"]
+        distances = [280, 250, 60, 100]
+
+        ok, reasons = stats.validate_distance_claims(
+            handicaps, clubs, np.array(distances)
+        )
+
+        for i in range(4):
+            s_ok, s_reason = stats.validate_distance_claim(
+                handicaps[i], clubs[i], distances[i]
+            )
+            assert bool(ok[i]) == s_ok
+            assert reasons[i] == s_reason
+
+
 class TestGlobalInstance:
     @patch("golfcaddie.statistics.GolfStatistics")
     def test_get_golf_statistics_singleton(self, mock_stats_class):
-        # Reset the global instance
-        import golfcaddie.statistics
-        golfcaddie.statistics._golf_stats = None
+        # Reset the cached instance
+        get_golf_statistics.cache_clear()
         
         # First call should create instance
         stats1 = get_golf_statistics()
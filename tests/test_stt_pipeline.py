@@ -23,7 +23,7 @@ async def test_mock_pipecat_pipeline_events():
     
     # Start pipeline and wait for events
     await pipeline.start()
-    await asyncio.sleep(0.5)  # Allow time for events to process
+    await pipeline.wait_until_drained()
     await pipeline.stop()
     
     # Verify we got the expected transcripts
@@ -3,16 +3,22 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from golfcaddie.weather import fetch_current_wind, compute_components, summarize_wind, get_wind
+from golfcaddie.weather import (
+    fetch_current_wind,
+    compute_components,
+    compute_components_batch,
+    summarize_wind,
+    get_wind,
+)
 
 
-@patch("httpx.Client")
-def test_fetch_current_wind_ok(mock_client_cls):
+@patch("golfcaddie.weather._get_client")
+def test_fetch_current_wind_ok(mock_get_client):
     client = Mock()
-    mock_client_cls.return_value.__enter__.return_value = client
-    client.get.return_value.json.return_value = {
-        "current": {"wind_speed_10m": 5.0, "wind_direction_10m": 270}
-    }
+    mock_get_client.return_value = client
+    client.get.return_value.content = json.dumps(
+        {"current": {"wind_speed_10m": 5.0, "wind_direction_10m": 270}}
+    ).encode()
     client.get.return_value.raise_for_status.return_value = None
 
     speed, direction = fetch_current_wind(51.5, -0.1)
@@ -20,14 +26,14 @@ def test_fetch_current_wind_ok(mock_client_cls):
     assert direction == 270
 
 
-@patch("httpx.Client")
-def test_fetch_current_wind_fallback_to_cache(mock_client_cls):
+@patch("golfcaddie.weather._get_client")
+def test_fetch_current_wind_fallback_to_cache(mock_get_client):
     # First call populates cache
     client = Mock()
-    mock_client_cls.return_value.__enter__.return_value = client
-    client.get.return_value.json.return_value = {
-        "current": {"wind_speed_10m": 4.0, "wind_direction_10m": 180}
-    }
+    mock_get_client.return_value = client
+    client.get.return_value.content = json.dumps(
+        {"current": {"wind_speed_10m": 4.0, "wind_direction_10m": 180}}
+    ).encode()
     client.get.return_value.raise_for_status.return_value = None
     s1, d1 = fetch_current_wind(40.0, -105.0)
     assert s1 == 4.0
@@ -39,6 +45,16 @@ def test_fetch_current_wind_fallback_to_cache(mock_client_cls):
     assert s2 == 4.0 and d2 == 180
 
 
+def test_fetch_current_wind_many_serves_cached():
+    import asyncio
+
+    from golfcaddie import weather
+
+    weather._store_cache(10.0, 20.0, 3.0, 90)
+    res = asyncio.run(weather.fetch_current_wind_many([(10.0, 20.0)]))
+    assert res == [(3.0, 90)]
+
+
 def test_compute_components_geometry():
     # Wind from west (270) blows toward east; target bearing north (0)
     head, cross = compute_components(5.0, 270, 0)
@@ -47,6 +63,54 @@ def test_compute_components_geometry():
     assert cross < -4.0
 
 
+def test_compute_components_lut_matches_float_trig():
+    # Integer bearings take the lookup-table path; float inputs take the
+    # trig path. Both must agree.
+    for direction in (0, 90, 213, 359):
+        for bearing in (0, 45, 270):
+            hi, ci = compute_components(5.0, direction, bearing)
+            hf, cf = compute_components(5.0, float(direction), float(bearing))
+            assert hi == pytest.approx(hf, abs=1e-6)
+            assert ci == pytest.approx(cf, abs=1e-6)
+
+
+def test_compute_components_batch_matches_scalar():
+    import numpy as np
+
+    bearings = np.array([0, 45, 90, 213, 359])
+    head, cross = compute_components_batch(5.0, 270, bearings)
+    for i, b in enumerate(bearings):
+        h, c = compute_components(5.0, 270, int(b))
+        assert head[i] == pytest.approx(h)
+        assert cross[i] == pytest.approx(c)
+
+
+def test_get_wind_batch_matches_scalar(monkeypatch):
+    import numpy as np
+
+    from golfcaddie.weather import get_wind_batch
+
+    calls = []
+
+    def _stub_fetch(lat, lon):
+        calls.append((lat, lon))
+        return 5.0, 270
+
+    monkeypatch.setattr("golfcaddie.weather.fetch_current_wind", _stub_fetch)
+    # Same tee box for every hole: the fetch should be deduplicated.
+    lats = np.full(4, 51.5001)
+    lons = np.full(4, -0.1002)
+    bearings = np.array([0, 45, 90, 213])
+    out = get_wind_batch(lats, lons, bearings)
+    assert len(calls) == 1
+    for i, b in enumerate(bearings):
+        h, c = compute_components(5.0, 270, int(b))
+        assert out.head[i] == pytest.approx(h)
+        assert out.cross[i] == pytest.approx(c)
+        assert out.speed[i] == 5.0
+        assert out.direction[i] == 270
+
+
 def test_get_wind_summary(monkeypatch):
     # stub fetch
     monkeypatch.setattr("golfcaddie.weather.fetch_current_wind", lambda lat, lon: (6.0, 180))